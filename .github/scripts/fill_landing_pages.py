@@ -1,21 +1,95 @@
+import argparse
 import csv
+import html as htmllib
+import json
 import re
 import unicodedata
 from pathlib import Path
 
+import stage_loader
+
 # Runs in CI from repo root. Mutates files under public/**.
 PUBLIC_DIR = Path("public")
 KEYWORDS_CSV = PUBLIC_DIR / "landing-pages-keywords.csv"
+# Same ledger the sheet sync appends to; scripts/submit_indexnow.py submits it.
+CHANGED_LEDGER = Path(".cache") / "changed-pages.txt"
+# Accepted LLM guides from scripts/generate_llm_content.py; index.json maps keyword -> cache entry.
+LLM_CACHE_DIR = Path(".cache") / "llm"
+LLM_INDEX = "index.json"
 
 AUTO_START = "<!-- AUTO_SEO_START -->"
 AUTO_END = "<!-- AUTO_SEO_END -->"
 
+# Opening line of the static route guide (here and in sync_from_sheet_vuka.build_seo_block).
+STATIC_GUIDE_MARK = "Getting a low fare is great"
+_SCROLL_RE = re.compile(
+    r"(<div class=\"seo-content-box__scroll\">\n)(.*)(\n\s*</div>\s*</section>\s*" + re.escape(AUTO_END) + ")",
+    flags=re.DOTALL,
+)
+
 
 def _word_count(text: str) -> int:
     return len([w for w in re.split(r"\s+", text.strip()) if w])
 
 
-def build_blocks(keyword: str, location: str | None = None) -> tuple[str, str, str]:
+def text_to_html(keyword: str, text: str) -> str:
+    """Render an LLM guide's restricted Markdown to the same tags the static guide uses."""
+    out = [f"<h3>A detailed guide to booking {htmllib.escape(keyword.strip().lower())}</h3>"]
+    bullets: list[str] = []
+
+    def flush() -> None:
+        if bullets:
+            out.append("<ul>\n" + "\n".join(f"  <li>{b}</li>" for b in bullets) + "\n</ul>")
+            bullets.clear()
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            flush()
+            continue
+        line = line.replace("**", "")
+        if line.startswith("#"):
+            flush()
+            out.append(f"<h4>{htmllib.escape(line.lstrip('#').strip())}</h4>")
+        elif line.startswith(("- ", "* ")):
+            bullets.append(htmllib.escape(line[2:].strip()))
+        else:
+            flush()
+            out.append(f"<p>{htmllib.escape(line)}</p>")
+    flush()
+    return "\n".join(out)
+
+
+def cached_guide(keyword: str) -> str | None:
+    # The LLM guide generated for this keyword, if any, so re-fills keep it instead of the static copy.
+    index_fp = LLM_CACHE_DIR / LLM_INDEX
+    if not index_fp.exists():
+        return None
+    key = json.loads(index_fp.read_text(encoding="utf-8")).get(keyword.strip().lower())
+    fp = LLM_CACHE_DIR / f"{key}.json"
+    if not key or not fp.exists():
+        return None
+    return text_to_html(keyword, json.loads(fp.read_text(encoding="utf-8"))["text"])
+
+
+def page_guide(html: str) -> str | None:
+    """The route-guide box content of a page whose guide is not the static copy (committed generated copy)."""
+    start, end = html.find(AUTO_START), html.find(AUTO_END)
+    if start < 0 or end < 0:
+        return None
+    m = _SCROLL_RE.search(html, start, end + len(AUTO_END))
+    if not m or STATIC_GUIDE_MARK in m.group(2):
+        return None
+    return m.group(2)
+
+
+def keep_guide(block: str, guide: str) -> str:
+    # Swap a freshly built block's route-guide box content for the page's existing guide.
+    return _SCROLL_RE.sub(lambda m: m.group(1) + guide + m.group(3), block, count=1)
+
+
+def build_blocks(keyword: str, location: str | None = None, long_html: str | None = None) -> tuple[str, str, str]:
+    # long_html replaces the static long-form guide (e.g. LLM copy); FAQ and layout stay the same.
     kw = keyword.strip().lower()
     loc = (location or "").strip()
 
@@ -156,7 +230,8 @@ def build_blocks(keyword: str, location: str | None = None) -> tuple[str, str, s
         combined_text = re.sub(r"<[^>]+>", " ", footer_html + " " + " ".join(sections))
         i += 1
 
-    long_html = "\n".join(sections)
+    if long_html is None:
+        long_html = "\n".join(sections)
 
     faqs = [
         (f"Do you offer help with {kw}?", f"Yes. We can check live availability and share options for {kw}, including baggage-inclusive fares and sensible connections."),
@@ -242,34 +317,70 @@ def url_to_public_path(url: str) -> Path:
     return PUBLIC_DIR / slug / "index.html"
 
 
-def main() -> int:
-    if not KEYWORDS_CSV.exists():
-        print(f"Missing {KEYWORDS_CSV}")
-        return 2
-
-    updated = 0
+def read_primary_rows() -> list[tuple[str, str, str]]:
+    # (landing url, keyword, location) for every Primary row with a URL and keyword.
+    rows = []
     with KEYWORDS_CSV.open("r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
+        for r in csv.DictReader(f):
             if (r.get("Template Type") or "").strip().lower() != "primary":
                 continue
             url = (r.get("Landing URL") or "").strip()
             kw = (r.get("Keyword") or "").strip()
             loc = (r.get("Location") or "").strip()
-            if not url or not kw:
-                continue
+            if url and kw:
+                rows.append((url, kw, loc))
+    return rows
+
+
+def fill_page(url: str, kw: str, loc: str, long_html: str | None = None) -> bool:
+    # Returns True when the page exists and its bytes changed.
+    fp = url_to_public_path(url)
+    if not fp.exists():
+        return False
+
+    html = fp.read_text(encoding="utf-8")
+    if long_html is None:
+        long_html = cached_guide(kw)
+    title, meta, block = build_blocks(kw, loc, long_html)
+    # The LLM cache is not committed: without it, keep a guide the page already has over the static copy.
+    guide = page_guide(html) if long_html is None else None
+    if guide is not None:
+        block = keep_guide(block, guide)
+    html2 = _replace_meta(html, title, meta)
+    html2 = inject_before_footer(html2, block)
+    if html2 == html:
+        return False
+    fp.write_text(html2, encoding="utf-8")
+    note_changed(fp.parent.name)
+    return True
+
+
+def note_changed(slug: str) -> None:
+    CHANGED_LEDGER.parent.mkdir(parents=True, exist_ok=True)
+    with CHANGED_LEDGER.open("a", encoding="utf-8") as f:
+        f.write(slug + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Re-render AUTO_SEO blocks from the keywords CSV.")
+    ap.add_argument("--shard", help="Only fill pages whose slug hashes to shard i of N (e.g. 2/4)")
+    args = ap.parse_args(argv)
 
-            fp = url_to_public_path(url)
-            if not fp.exists():
-                continue
+    if not KEYWORDS_CSV.exists():
+        print(f"Missing {KEYWORDS_CSV}")
+        return 2
+
+    rows = read_primary_rows()
+    if args.shard:
+        # Same parsing and slug hash as the sheet sync, so a CI shard fills exactly the pages it synced.
+        sync = stage_loader.load_stage("sync_from_sheet_vuka")
+        i, n = sync.parse_shard(args.shard)
+        rows = [r for r in rows if sync.shard_index(url_to_public_path(r[0]).parent.name, n) == i]
 
-            html = fp.read_text(encoding="utf-8")
-            title, meta, block = build_blocks(kw, loc)
-            html2 = _replace_meta(html, title, meta)
-            html2 = inject_before_footer(html2, block)
-            if html2 != html:
-                fp.write_text(html2, encoding="utf-8")
-                updated += 1
+    updated = 0
+    for url, kw, loc in rows:
+        if fill_page(url, kw, loc):
+            updated += 1
 
     print(f"Filled SEO blocks for {updated} landing pages")
     return 0
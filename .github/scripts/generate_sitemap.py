@@ -4,6 +4,11 @@ import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+import stage_loader
+
+# Runs in CI from repo root, after the Vite build.
+DIST_DIR = Path("dist")
+
 
 def _iter_index_paths(dist: Path):
     # Include index.html but exclude assets-like dirs
@@ -15,6 +20,12 @@ def _iter_index_paths(dist: Path):
         yield p
 
 
+def _redirect_aliases() -> set[str]:
+    # Alias slugs answer with a 301 (see sync_from_sheet_vuka.collect_redirect_aliases), so they stay out.
+    sync = stage_loader.load_stage("sync_from_sheet_vuka")
+    return set(sync.collect_redirect_aliases())
+
+
 def _url_from_rel(base_url: str, rel: Path) -> str:
     # dist/index.html -> /
     # dist/foo/index.html -> /foo/
@@ -27,14 +38,21 @@ def _url_from_rel(base_url: str, rel: Path) -> str:
 
 
 def main() -> int:
-    dist = Path("dist")
+    dist = DIST_DIR
     if not dist.exists():
         print("dist/ not found. Did build run?")
         return 2
 
     base_url = os.environ.get("BASE_URL", "https://vukatravels.co.uk/")
 
-    urls = sorted({_url_from_rel(base_url, p.relative_to(dist)) for p in _iter_index_paths(dist)})
+    aliases = _redirect_aliases()
+    urls = sorted(
+        {
+            _url_from_rel(base_url, p.relative_to(dist))
+            for p in _iter_index_paths(dist)
+            if p.relative_to(dist).parts[0] not in aliases
+        }
+    )
 
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00")
 
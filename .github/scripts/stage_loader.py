@@ -0,0 +1,36 @@
+"""Load another pipeline stage from a .github/scripts stage.
+
+The stage scripts here run both through `vuka` (scripts/ already on sys.path)
+and straight from CI (`python .github/scripts/<stage>.py`, where it is not).
+Either way a sibling stage is loaded through scripts/pipeline.py, so it gets
+the same configured paths `vuka` would give it.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import ModuleType
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+
+
+def _pipeline() -> ModuleType:
+    try:
+        import pipeline  # on sys.path when run through scripts/vuka.py
+    except ImportError:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        import pipeline
+    return pipeline
+
+
+def load_stage(name: str) -> ModuleType:
+    return _pipeline().load_stage(name)
+
+
+def root() -> Path:
+    return _pipeline().root()
+
+
+def set_root(root: Path) -> None:
+    _pipeline().set_root(root)
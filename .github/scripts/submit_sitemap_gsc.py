@@ -1,9 +1,6 @@
 import json
 import os
 
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-
 
 def main():
     site_url = os.environ.get("GSC_SITE_URL")
@@ -14,6 +11,9 @@ def main():
         print("Missing env vars. Required: GSC_SITE_URL, SITEMAP_URL, GSC_SA_JSON")
         return 2
 
+    from google.oauth2.service_account import Credentials
+    from googleapiclient.discovery import build
+
     info = json.loads(sa_json)
     scopes = ["https://www.googleapis.com/auth/webmasters"]
     creds = Credentials.from_service_account_info(info, scopes=scopes)
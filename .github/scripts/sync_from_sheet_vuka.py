@@ -1,12 +1,15 @@
+import argparse
+import csv
+import hashlib
 import json
 import os
 import re
+import sys
 import unicodedata
 from datetime import date
 from pathlib import Path
 
-import gspread
-from google.oauth2.service_account import Credentials
+import stage_loader
 
 # Same master sheet used by UmrahGuider automation
 MASTER_URL = os.environ.get(
@@ -16,11 +19,34 @@ MASTER_URL = os.environ.get(
 
 SITE_KEY = os.environ.get("VUKA_SITE_KEY", "vukatravels.co.uk")
 SITE_BASE = os.environ.get("VUKA_SITE_BASE", "https://vukatravels.co.uk")
+# Name used in titles/meta and the short form used in body copy; set per site by apply_site_config().
+DEFAULT_BRAND = {"name": "VUKA Travels", "short": "VUKA"}
+BRAND_NAME = DEFAULT_BRAND["name"]
+BRAND_SHORT = DEFAULT_BRAND["short"]
 
 REPO_ROOT = Path(".").resolve()
 PUBLIC_DIR = REPO_ROOT / "public"
 KEYWORDS_CSV = PUBLIC_DIR / "landing-pages-keywords.csv"
 SITEMAP_XML = PUBLIC_DIR / "sitemap.xml"
+# slug -> source template + digest of the template chrome the page was built from
+MANIFEST_JSON = PUBLIC_DIR / "landing-pages-manifest.json"
+
+# Alias slugs are served as single-hop 301s by the web server. Both files are regenerated on every sync:
+# - nginx: `include` the map inside a `map $uri $vuka_redirect { ... }` block (see docs/blog-deployment-nginx.md)
+# - Apache/LiteSpeed (Hostinger): a marked block inside public/.htaccess
+NGINX_REDIRECT_MAP = REPO_ROOT / "deploy" / "nginx-redirects.map"
+HTACCESS = PUBLIC_DIR / ".htaccess"
+HTACCESS_START = "# BEGIN VUKA_REDIRECTS"
+HTACCESS_END = "# END VUKA_REDIRECTS"
+
+# Slugs of pages whose bytes changed, one per line; scripts/submit_indexnow.py submits and clears it.
+CHANGED_LEDGER = REPO_ROOT / ".cache" / "changed-pages.txt"
+
+# Per-shard results (`--shard i/N`) are written here and combined by `--merge`.
+SHARD_DIR = REPO_ROOT / ".cache" / "shards"
+
+# HTML meta-refresh stubs are only a fallback for hosts that ignore both redirect files.
+REDIRECT_STUBS = os.environ.get("VUKA_REDIRECT_STUBS", "1") != "0"
 
 AUTO_START = "<!-- AUTO_SEO_START -->"
 AUTO_END = "<!-- AUTO_SEO_END -->"
@@ -29,6 +55,19 @@ TEMPLATE_PRIMARY_CHEAP = "cheap-flights-from-london-to-accra"
 TEMPLATE_PRIMARY_UK = "flights-to-accra-from-uk"
 TEMPLATE_ALIAS = "flights-from-london-to-accra"
 
+# Head tags that belong to the page, not the template. Everything else in <head>, plus the
+# footer/scripts after the page body, is "template chrome" and is rolled out on template edits.
+PAGE_HEAD_TAGS = [
+    r"<title>.*?</title>",
+    r"<meta\s+name=\"description\"[^>]*>",
+    r"<link\s+rel=\"canonical\"[^>]*>",
+    r"<meta\s+property=\"og:title\"[^>]*>",
+    r"<meta\s+property=\"og:description\"[^>]*>",
+    r"<meta\s+property=\"og:url\"[^>]*>",
+    r"<meta\s+name=\"twitter:title\"[^>]*>",
+    r"<meta\s+name=\"twitter:description\"[^>]*>",
+]
+
 
 def slugify(s: str) -> str:
     s = unicodedata.normalize("NFKD", s)
@@ -44,11 +83,12 @@ def _wc(text: str) -> int:
     return len([w for w in re.split(r"\s+", text.strip()) if w])
 
 
-def build_seo_block(keyword: str, location: str = "") -> tuple[str, str, str]:
+def build_seo_block(keyword: str, location: str = "", long_html: str | None = None) -> tuple[str, str, str]:
+    # long_html replaces the static long-form guide (an accepted LLM guide); FAQ and layout stay the same.
     kw = keyword.strip().lower()
-    title = f"{keyword.title()} | Live Quotes & Route Tips | VUKA Travels"
+    title = f"{keyword.title()} | Live Quotes & Route Tips | {BRAND_NAME}"
     meta = (
-        f"{keyword.title()} with booking tips, baggage guidance, and quick quote support from VUKA Travels. "
+        f"{keyword.title()} with booking tips, baggage guidance, and quick quote support from {BRAND_NAME}. "
         "Compare direct vs 1-stop options and request a live fare."
     )
 
@@ -57,7 +97,7 @@ def build_seo_block(keyword: str, location: str = "") -> tuple[str, str, str]:
     footer_html = "\n".join([
         f"<h2>{h2} — practical booking guidance</h2>",
         f"<p>If you’re searching for <strong>{kw}</strong>, you probably want two things: a good price <em>and</em> a booking that doesn’t turn into stress (baggage surprises, awkward connections, or confusing fare rules).</p>",
-        "<p>VUKA helps you shortlist realistic options based on your dates, baggage needs, and flexibility — and we’ll explain the trade-offs clearly before you pay.</p>",
+        f"<p>{BRAND_SHORT} helps you shortlist realistic options based on your dates, baggage needs, and flexibility — and we’ll explain the trade-offs clearly before you pay.</p>",
         "<p><strong>What we help with:</strong></p>",
         "<ul>",
         "  <li>Direct vs one‑stop comparisons (total journey time matters)</li>",
@@ -111,7 +151,7 @@ def build_seo_block(keyword: str, location: str = "") -> tuple[str, str, str]:
     ]))
 
     sections.append(h4("5) Next steps"))
-    sections.append(p(f"If you want a live quote for <strong>{kw}</strong>, contact VUKA with your dates and baggage requirement and we’ll shortlist sensible options."))
+    sections.append(p(f"If you want a live quote for <strong>{kw}</strong>, contact {BRAND_SHORT} with your dates and baggage requirement and we’ll shortlist sensible options."))
 
     # pad to ~2000 words
     extra = [
@@ -160,7 +200,7 @@ def build_seo_block(keyword: str, location: str = "") -> tuple[str, str, str]:
         "  </div>",
         "  <div class=\"seo-content-box__scroll\">",
         footer_html,
-        "\n".join(sections),
+        long_html if long_html is not None else "\n".join(sections),
         "  </div>",
         "</section>",
         AUTO_END,
@@ -229,14 +269,51 @@ def url_to_slug(url: str) -> str:
     return path.strip("/")
 
 
-def clone_template(template_slug: str, dest_slug: str) -> str:
+def split_template_regions(html: str) -> tuple[str, str, str]:
+    # (head, body up to the footer, footer + trailing scripts)
+    head_end = html.find("</head>")
+    m = re.search(r"\n\s*<footer\b", html)
+    if head_end < 0 or not m:
+        raise ValueError("Page has no </head> or <footer> to split on")
+    return html[:head_end], html[head_end : m.start()], html[m.start() :]
+
+
+def template_digest(html: str) -> str:
+    head, _, tail = split_template_regions(html)
+    for pattern in PAGE_HEAD_TAGS:
+        head = re.sub(pattern, "", head, flags=re.DOTALL)
+    return hashlib.sha256((head + tail).encode("utf-8")).hexdigest()
+
+
+def load_manifest() -> dict:
+    if not MANIFEST_JSON.exists():
+        return {"version": 1, "pages": {}}
+    return json.loads(MANIFEST_JSON.read_text(encoding="utf-8"))
+
+
+def save_manifest(manifest: dict) -> None:
+    manifest["pages"] = dict(sorted(manifest["pages"].items()))
+    MANIFEST_JSON.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+def record_template(manifest: dict, dest_slug: str, template_slug: str, template_html: str) -> None:
+    manifest["pages"][dest_slug] = {
+        "template": template_slug,
+        "template_digest": template_digest(template_html),
+    }
+
+
+def clone_template(template_slug: str, dest_slug: str, manifest: dict | None = None) -> str:
     src = PUBLIC_DIR / template_slug / "index.html"
     if not src.exists():
         raise FileNotFoundError(f"Template not found: {src}")
     dest_dir = PUBLIC_DIR / dest_slug
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest = dest_dir / "index.html"
-    dest.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
+    html = src.read_text(encoding="utf-8")
+    dest.write_text(html, encoding="utf-8")
+    if manifest is not None:
+        record_template(manifest, dest_slug, template_slug, html)
     return str(dest)
 
 
@@ -267,6 +344,65 @@ def build_redirect_alias(dest_slug: str, canonical_slug: str, title: str) -> str
     return str(dest)
 
 
+def alias_canonical_slug(slug: str) -> str:
+    # Default mapping: "flights-from-<origin>-to-<dest>" -> "cheap-flights-from-<origin>-to-<dest>".
+    return re.sub(r"^flights-from-", "cheap-flights-from-", slug)
+
+
+def collect_redirect_aliases() -> dict[str, str]:
+    # alias slug -> canonical slug, from the keywords CSV plus any existing meta-refresh stubs on disk.
+    aliases: dict[str, str] = {}
+
+    if KEYWORDS_CSV.exists():
+        with KEYWORDS_CSV.open("r", encoding="utf-8") as f:
+            for r in csv.DictReader(f):
+                if (r.get("Template Type") or "").strip().lower() != "redirect alias":
+                    continue
+                slug = url_to_slug((r.get("Landing URL") or "").strip())
+                # Never 301 to a page that was never built.
+                if slug and (PUBLIC_DIR / alias_canonical_slug(slug) / "index.html").exists():
+                    aliases[slug] = alias_canonical_slug(slug)
+
+    for d in PUBLIC_DIR.iterdir():
+        fp = d / "index.html"
+        if not d.is_dir() or not fp.exists():
+            continue
+        m = re.search(r"<meta\s+http-equiv=\"refresh\"\s+content=\"0;\s*url=([^\"]+)\"", fp.read_text(encoding="utf-8"))
+        if m:
+            aliases[d.name] = url_to_slug(m.group(1))
+
+    return {k: v for k, v in sorted(aliases.items()) if v and v != k}
+
+
+def write_redirect_maps(aliases: dict[str, str]) -> None:
+    map_lines = ["# Generated by sync_from_sheet_vuka.py. Do not edit by hand."]
+    rules = []
+    for alias, canonical in aliases.items():
+        target = f"/{canonical}/"
+        map_lines.append(f"/{alias} {target};")
+        map_lines.append(f"/{alias}/ {target};")
+        map_lines.append(f"/{alias}/index.html {target};")
+        rules.append(f"  RedirectMatch 301 ^/{alias}(/|/index\\.html)?$ {target}")
+
+    NGINX_REDIRECT_MAP.parent.mkdir(parents=True, exist_ok=True)
+    NGINX_REDIRECT_MAP.write_text("\n".join(map_lines) + "\n", encoding="utf-8")
+
+    block = "\n".join([
+        HTACCESS_START,
+        "<IfModule mod_alias.c>",
+        *rules,
+        "</IfModule>",
+        HTACCESS_END,
+    ])
+    existing = HTACCESS.read_text(encoding="utf-8") if HTACCESS.exists() else ""
+    if HTACCESS_START in existing and HTACCESS_END in existing:
+        updated = re.sub(re.escape(HTACCESS_START) + r".*?" + re.escape(HTACCESS_END), lambda _: block, existing, flags=re.DOTALL)
+    else:
+        updated = block + "\n" + (("\n" + existing) if existing else "")
+    if updated != existing:
+        HTACCESS.write_text(updated, encoding="utf-8")
+
+
 def generate_sitemap():
     # Simple sitemap: core pages + any public/*/index.html directories.
     today = date.today().isoformat()
@@ -280,9 +416,11 @@ def generate_sitemap():
         ("/contact", "0.8", "monthly"),
     ]
 
+    # Alias slugs answer with a 301, so only their canonical pages are listed.
+    aliases = collect_redirect_aliases()
     urls = []
     for d in PUBLIC_DIR.iterdir():
-        if d.is_dir() and (d / "index.html").exists():
+        if d.is_dir() and (d / "index.html").exists() and d.name not in aliases:
             slug = d.name.strip("/")
             urls.append(f"{SITE_BASE.rstrip('/')}/{slug}/")
 
@@ -329,7 +467,11 @@ def parse_notes(notes: str) -> dict:
     return out
 
 
-def main():
+def open_master_sheet():
+    # Google clients are imported here so offline stages never pay for them.
+    import gspread
+    from google.oauth2.service_account import Credentials
+
     sa_json = os.environ.get("SHEETS_SA_JSON")
     if not sa_json:
         raise SystemExit("Missing SHEETS_SA_JSON (service account JSON string)")
@@ -342,7 +484,23 @@ def main():
     creds = Credentials.from_service_account_info(info, scopes=scopes)
     gc = gspread.authorize(creds)
 
-    ws = gc.open_by_url(MASTER_URL).sheet1
+    return gc.open_by_url(MASTER_URL).sheet1
+
+
+def classify_template(keyword: str, meta: dict) -> str:
+    # Decide template type: explicit notes win, otherwise infer from the phrase.
+    template_type = meta.get("template")
+    if not template_type:
+        if "flights from london to" in keyword.lower():
+            template_type = "alias"
+        elif "flights to" in keyword.lower() and "from uk" in keyword.lower():
+            template_type = "uk"
+        else:
+            template_type = "cheap"
+    return template_type
+
+
+def read_master_rows(ws) -> tuple[dict[str, int], list[tuple[int, list[str]]]]:
     header = ws.row_values(1)
     values = ws.get_all_values()
     idx = {name: i for i, name in enumerate(header)}
@@ -352,13 +510,101 @@ def main():
         if r not in idx:
             raise SystemExit(f"Master sheet missing column: {r}")
 
+    return idx, list(enumerate(values[1:], start=2))
+
+
+def load_sites_config() -> dict[str, dict]:
+    # Multi-site mode: VUKA_SITES_CONFIG points at a JSON file mapping site key -> config, e.g.
+    #   {"umrahguider.com": {"public_dir": "../umrahguider/public", "base_url": "https://umrahguider.com",
+    #                        "templates": {"cheap": "...", "uk": "..."},
+    #                        "brand": {"name": "UmrahGuider", "short": "UmrahGuider"}}}
+    # Relative paths resolve against REPO_ROOT. Without it only SITE_KEY is synced, as before.
+    # Every configured site must name its brand, or its pages would go out with VUKA copy.
+    sites = {
+        SITE_KEY: {
+            "public_dir": str(PUBLIC_DIR),
+            "base_url": SITE_BASE,
+            "templates": {"cheap": TEMPLATE_PRIMARY_CHEAP, "uk": TEMPLATE_PRIMARY_UK},
+            "brand": DEFAULT_BRAND,
+        }
+    }
+    path = os.environ.get("VUKA_SITES_CONFIG")
+    if path:
+        sites = json.loads(Path(path).read_text(encoding="utf-8"))
+        unbranded = sorted(k for k, cfg in sites.items() if not (cfg.get("brand") or {}).get("name"))
+        if unbranded:
+            raise SystemExit(f"{path}: sites without a brand name: {', '.join(unbranded)}")
+    return sites
+
+
+def apply_site_config(site_key: str, cfg: dict) -> None:
+    global SITE_KEY, SITE_BASE, REPO_ROOT, PUBLIC_DIR, KEYWORDS_CSV, SITEMAP_XML, MANIFEST_JSON
+    global NGINX_REDIRECT_MAP, HTACCESS, TEMPLATE_PRIMARY_CHEAP, TEMPLATE_PRIMARY_UK, CHANGED_LEDGER
+    global BRAND_NAME, BRAND_SHORT
+
+    public = Path(cfg["public_dir"])
+    if not public.is_absolute():
+        public = (REPO_ROOT / public).resolve()
+    root = Path(cfg["root"]).resolve() if cfg.get("root") else public.parent
+
+    SITE_KEY = site_key
+    SITE_BASE = cfg.get("base_url") or f"https://{site_key}"
+    REPO_ROOT = root
+    PUBLIC_DIR = public
+    KEYWORDS_CSV = public / "landing-pages-keywords.csv"
+    SITEMAP_XML = public / "sitemap.xml"
+    MANIFEST_JSON = public / "landing-pages-manifest.json"
+    NGINX_REDIRECT_MAP = root / "deploy" / "nginx-redirects.map"
+    HTACCESS = public / ".htaccess"
+    CHANGED_LEDGER = root / ".cache" / "changed-pages.txt"
+    templates = cfg.get("templates") or {}
+    TEMPLATE_PRIMARY_CHEAP = templates.get("cheap", TEMPLATE_PRIMARY_CHEAP)
+    TEMPLATE_PRIMARY_UK = templates.get("uk", TEMPLATE_PRIMARY_UK)
+    brand = cfg.get("brand") or DEFAULT_BRAND
+    BRAND_NAME = brand["name"]
+    BRAND_SHORT = brand.get("short") or brand["name"]
+
+
+def note_changed(slug: str) -> None:
+    CHANGED_LEDGER.parent.mkdir(parents=True, exist_ok=True)
+    with CHANGED_LEDGER.open("a", encoding="utf-8") as f:
+        f.write(slug + "\n")
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    # "2/4" -> (2, 4); shards are numbered from 1 like a CI matrix.
+    m = re.fullmatch(r"(\d+)/(\d+)", spec.strip())
+    if not m or not 1 <= int(m.group(1)) <= int(m.group(2)):
+        raise SystemExit(f"Invalid --shard {spec!r}, expected i/N with 1 <= i <= N")
+    return int(m.group(1)), int(m.group(2))
+
+
+def shard_index(slug: str, count: int) -> int:
+    # Stable across runs and machines (unlike hash()); fill_landing_pages.py calls this one for --shard.
+    return int(hashlib.sha1(slug.encode("utf-8")).hexdigest()[:8], 16) % count + 1
+
+
+def row_slug(row: list[str], idx: dict[str, int]) -> str:
+    slug = (row[idx["slug"]] if len(row) > idx["slug"] else "").strip()
+    if slug:
+        return slug
+    return slugify((row[idx["primary_keyword"]] if len(row) > idx["primary_keyword"] else "").strip())
+
+
+def process_site_rows(rows: list[tuple[int, list[str]]], idx: dict[str, int], sharded: bool = False) -> dict:
+    """Build/refresh pages for one site's rows. Sheet edits are returned, not written.
+
+    A sharded run only writes its own page directories; keyword CSV rows and manifest
+    entries are returned so merge_shards() can apply them once.
+    """
     changed = 0
+    updates: list[tuple[int, int, str]] = []  # (row, col, value), 1-based like gspread
+    keyword_rows: list[tuple[int, str, str, str, str]] = []  # (sheet row, location, keyword, url, type)
+    manifest = {"version": 1, "pages": {}} if sharded else load_manifest()
+    aliases: list[tuple[int, str, str, str, str]] = []  # (sheet row, location, keyword, url, slug)
+    changed_pages: list[str] = []  # also in this checkout's ledger; a shard hands them to --merge
 
-    for row_num, row in enumerate(values[1:], start=2):
-        site = (row[idx["site"]] if len(row) > idx["site"] else "").strip()
-        if site != SITE_KEY:
-            continue
-
+    for row_num, row in rows:
         status = (row[idx["status"]] if len(row) > idx["status"] else "").strip()
         if status.lower() != "approved":
             continue
@@ -374,56 +620,224 @@ def main():
         slug = (row[idx["slug"]] if len(row) > idx["slug"] else "").strip()
         if not slug:
             slug = slugify(keyword)
-            ws.update_cell(row_num, idx["slug"] + 1, slug)
+            updates.append((row_num, idx["slug"] + 1, slug))
             changed += 1
 
         # target_url
         target_url = (row[idx["target_url"]] if len(row) > idx["target_url"] else "").strip()
         if not target_url:
             target_url = f"{SITE_BASE.rstrip('/')}/{slug}/"
-            ws.update_cell(row_num, idx["target_url"] + 1, target_url)
+            updates.append((row_num, idx["target_url"] + 1, target_url))
             changed += 1
 
-        # Decide template type
-        template_type = meta.get("template")
-        if not template_type:
-            if "flights from london to" in keyword.lower():
-                template_type = "alias"
-            elif "flights to" in keyword.lower() and "from uk" in keyword.lower():
-                template_type = "uk"
-            else:
-                template_type = "cheap"
+        template_type = classify_template(keyword, meta)
 
         if template_type == "alias":
-            # Redirect aliases should point to the corresponding 'cheap' page if it exists
-            # Default mapping: replace leading phrase.
-            canonical_slug = slug.replace("flights-from-london-to-", "cheap-flights-from-london-to-")
-            build_redirect_alias(slug, canonical_slug, keyword.title())
-            append_keyword_row(meta.get("location", ""), keyword, target_url, "Redirect Alias")
+            # Decided after the loop, once this run's own cheap-flights pages exist.
+            aliases.append((row_num, meta.get("location", ""), keyword, target_url, slug))
             continue
 
         # Ensure file exists by cloning template
         if not (PUBLIC_DIR / slug / "index.html").exists():
             tpl = TEMPLATE_PRIMARY_UK if template_type == "uk" else TEMPLATE_PRIMARY_CHEAP
-            clone_template(tpl, slug)
+            clone_template(tpl, slug, manifest)
+            note_changed(slug)
+            changed_pages.append(slug)
             changed += 1
 
         # Fill SEO blocks
         fp = PUBLIC_DIR / slug / "index.html"
         html = fp.read_text(encoding="utf-8")
-        title, meta_desc, block = build_seo_block(keyword, meta.get("location", ""))
+        # LLM guides are written in VUKA's voice (scripts/generate_llm_content.py); other brands keep the static copy.
+        fill = stage_loader.load_stage("fill_landing_pages")
+        guide = fill.cached_guide(keyword) if BRAND_NAME == DEFAULT_BRAND["name"] else None
+        title, meta_desc, block = build_seo_block(keyword, meta.get("location", ""), guide)
+        # CI has no LLM cache: a generated guide already committed in the page stays.
+        kept = fill.page_guide(html) if guide is None else None
+        if kept is not None:
+            block = fill.keep_guide(block, kept)
         html2 = replace_meta(html, title, meta_desc)
         html2 = inject_before_footer(html2, block)
         if html2 != html:
             fp.write_text(html2, encoding="utf-8")
+            note_changed(slug)
+            changed_pages.append(slug)
             changed += 1
 
-        append_keyword_row(meta.get("location", ""), keyword, target_url, "Primary")
-
+        keyword_rows.append((row_num, meta.get("location", ""), keyword, target_url, "Primary"))
+
+    result = {"site": SITE_KEY, "changed": changed, "updates": updates}
+    if sharded:
+        # Aliases wait for the merge too: their cheap-flights page may be built by another shard.
+        result.update({
+            "keyword_rows": keyword_rows,
+            "manifest_pages": manifest["pages"],
+            "aliases": aliases,
+            "changed_pages": sorted(set(changed_pages)),
+        })
+        return result
+
+    result.update(finalize_site(keyword_rows, manifest, aliases))
+    return result
+
+
+def resolve_aliases(aliases: list) -> tuple[list[tuple[int, str, str, str, str]], int]:
+    """Keyword rows for the aliases whose cheap-flights page exists, and how many were skipped.
+
+    A skipped alias gets no keyword CSV row, so it stays unbuilt and a later sync picks it up.
+    The server-side 301 maps are compiled from the CSV; the HTML stub is an optional fallback.
+    """
+    rows = []
+    skipped = 0
+    for row_num, location, keyword, target_url, slug in aliases:
+        canonical = alias_canonical_slug(slug)
+        if not (PUBLIC_DIR / canonical / "index.html").exists():
+            skipped += 1
+            continue
+        if REDIRECT_STUBS:
+            build_redirect_alias(slug, canonical, keyword.title())
+        rows.append((row_num, location, keyword, target_url, "Redirect Alias"))
+    return rows, skipped
+
+
+def finalize_site(keyword_rows: list, manifest: dict, aliases: list) -> dict:
+    # Shared, site-wide outputs: written once per site, never by individual shards.
+    alias_rows, skipped = resolve_aliases(aliases)
+    for _, location, keyword, url, template_type in sorted([*keyword_rows, *alias_rows]):
+        append_keyword_row(location, keyword, url, template_type)
+    save_manifest(manifest)
+    redirects = collect_redirect_aliases()
+    write_redirect_maps(redirects)
     generate_sitemap()
+    return {"redirects": len(redirects), "skipped_aliases": skipped}
+
+
+def _run_site(
+    site_key: str,
+    cfg: dict,
+    rows: list[tuple[int, list[str]]],
+    idx: dict[str, int],
+    sharded: bool = False,
+    roots: tuple[Path, Path] | None = None,
+) -> dict:
+    # Worker entry point: each site runs in its own process, so module-level paths never clash.
+    # `roots` is (REPO_ROOT, pipeline root) from the parent, passed explicitly: a spawn or
+    # forkserver worker re-imports this module and pipeline with their defaults, which would
+    # drop `vuka --root` and resolve relative public_dirs against the wrong checkout.
+    global REPO_ROOT
+    if roots:
+        stage_loader.set_root(roots[1])
+        REPO_ROOT = roots[0]
+    apply_site_config(site_key, cfg)
+    return process_site_rows(rows, idx, sharded)
+
+
+def write_back(ws, updates: list[tuple[int, int, str]]) -> None:
+    # One batch request for every site instead of an update_cell() call per edit.
+    if not updates:
+        return
+    import gspread
+
+    ws.update_cells([gspread.Cell(row, col, value) for row, col, value in updates])
+
+
+def merge_shards(shard_dir: Path) -> int:
+    """Apply every shard's CSV rows, manifest entries, aliases, changed pages and sheet edits, then build the sitemap once."""
+    files = sorted(shard_dir.glob("sync-shard-*.json"))
+    if not files:
+        raise SystemExit(f"No shard results in {shard_dir}")
+    shards = [json.loads(fp.read_text(encoding="utf-8")) for fp in files]
+
+    counts = {sh["count"] for sh in shards}
+    seen = sorted(sh["index"] for sh in shards)
+    if len(counts) != 1 or seen != list(range(1, counts.pop() + 1)):
+        raise SystemExit(f"Incomplete shard set in {shard_dir}: got {seen}")
+
+    sites = load_sites_config()
+    per_site: dict[str, dict] = {}
+    updates: list[tuple[int, int, str]] = []
+    for sh in shards:
+        for r in sh["sites"]:
+            merged = per_site.setdefault(
+                r["site"], {"changed": 0, "keyword_rows": [], "manifest_pages": {}, "aliases": [], "changed_pages": set()}
+            )
+            merged["changed"] += r["changed"]
+            merged["keyword_rows"].extend(tuple(k) for k in r["keyword_rows"])
+            merged["aliases"].extend(tuple(a) for a in r["aliases"])
+            merged["changed_pages"].update(r["changed_pages"])
+            merged["manifest_pages"].update(r["manifest_pages"])
+            updates.extend(tuple(u) for u in r["updates"])
+
+    results = []
+    for site, merged in per_site.items():
+        apply_site_config(site, sites[site])
+        manifest = load_manifest()
+        manifest["pages"].update(merged["manifest_pages"])
+        # Each shard's ledger stayed in its own job; submit_indexnow reads this checkout's.
+        ledger = set(CHANGED_LEDGER.read_text(encoding="utf-8").split()) if CHANGED_LEDGER.exists() else set()
+        for slug in sorted(merged["changed_pages"] - ledger):
+            note_changed(slug)
+        results.append({"site": site, "changed": merged["changed"], **finalize_site(merged["keyword_rows"], manifest, merged["aliases"])})
+
+    if updates:
+        write_back(open_master_sheet(), sorted(updates))
+
+    print("OK", {"shards": len(shards), "sites": results, "sheet_updates": len(updates)})
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Build VUKA landing pages from the master sheet.")
+    ap.add_argument("--shard", help="Only handle rows whose slug hashes to shard i of N (e.g. 2/4)")
+    ap.add_argument("--merge", type=Path, metavar="DIR", help="Combine the shard results in DIR and finish the run")
+    args = ap.parse_args(argv)
+
+    if args.merge:
+        return merge_shards(args.merge)
+
+    shard = parse_shard(args.shard) if args.shard else None
+
+    ws = open_master_sheet()
+    idx, rows = read_master_rows(ws)
+    sites = load_sites_config()
+
+    groups: dict[str, list[tuple[int, list[str]]]] = {}
+    for row_num, row in rows:
+        site = (row[idx["site"]] if len(row) > idx["site"] else "").strip()
+        if site not in sites:
+            continue
+        if shard and shard_index(row_slug(row, idx), shard[1]) != shard[0]:
+            continue
+        groups.setdefault(site, []).append((row_num, row))
+
+    sharded = shard is not None
+    if len(groups) <= 1:
+        results = [_run_site(site, sites[site], site_rows, idx, sharded) for site, site_rows in groups.items()]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        roots = (REPO_ROOT, stage_loader.root())
+        with ProcessPoolExecutor(max_workers=len(groups)) as pool:
+            futures = [
+                pool.submit(_run_site, site, sites[site], site_rows, idx, sharded, roots)
+                for site, site_rows in groups.items()
+            ]
+            results = [f.result() for f in futures]
+
+    if sharded:
+        # Sheet edits, CSV rows and manifest entries wait for `--merge`.
+        SHARD_DIR.mkdir(parents=True, exist_ok=True)
+        out = SHARD_DIR / f"sync-shard-{shard[0]}-of-{shard[1]}.json"
+        out.write_text(json.dumps({"index": shard[0], "count": shard[1], "sites": results}, indent=2) + "\n", encoding="utf-8")
+        print("OK", {"shard": args.shard, "sites": [{"site": r["site"], "changed": r["changed"]} for r in results], "out": str(out)})
+        return 0
+
+    updates = [u for r in results for u in r.pop("updates")]
+    write_back(ws, updates)
 
-    print("OK", {"changed": changed})
+    print("OK", {"sites": results, "sheet_updates": len(updates)})
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
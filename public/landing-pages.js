@@ -9,14 +9,14 @@
   var quoteDestination = page.getAttribute('data-destination') || quoteTo;
 
   var airlineRules = [
-    { pattern: /emirates/i, code: 'EK', name: 'Emirates', logo: '/airline-logos/emirates.svg' },
-    { pattern: /british airways/i, code: 'BA', name: 'British Airways', logo: '/airline-logos/britishairways.svg' },
-    { pattern: /etihad/i, code: 'EY', name: 'Etihad Airways', logo: '/airline-logos/etihadairways.svg' },
-    { pattern: /qatar/i, code: 'QR', name: 'Qatar Airways', logo: '/airline-logos/qatarairways.svg' },
-    { pattern: /pegasus/i, code: 'PC', name: 'Pegasus Airlines', logo: '/airline-logos/pegasusairlines.svg' },
-    { pattern: /kenya airways/i, code: 'KQ', name: 'Kenya Airways', logo: '/airline-logos/kenyaairways.svg' },
-    { pattern: /ethiopian/i, code: 'ET', name: 'Ethiopian Airlines', logo: '/airline-logos/ethiopianairlines.svg' },
-    { pattern: /turkish/i, code: 'TK', name: 'Turkish Airlines', logo: '/airline-logos/turkishairlines.svg' },
+    { pattern: /emirates/i, code: 'EK', name: 'Emirates', logo: '/airline-logos/sprite.393ffe7a04.svg#logo-emirates' },
+    { pattern: /british airways/i, code: 'BA', name: 'British Airways', logo: '/airline-logos/sprite.393ffe7a04.svg#logo-britishairways' },
+    { pattern: /etihad/i, code: 'EY', name: 'Etihad Airways', logo: '/airline-logos/sprite.393ffe7a04.svg#logo-etihadairways' },
+    { pattern: /qatar/i, code: 'QR', name: 'Qatar Airways', logo: '/airline-logos/sprite.393ffe7a04.svg#logo-qatarairways' },
+    { pattern: /pegasus/i, code: 'PC', name: 'Pegasus Airlines', logo: '/airline-logos/sprite.393ffe7a04.svg#logo-pegasusairlines' },
+    { pattern: /kenya airways/i, code: 'KQ', name: 'Kenya Airways', logo: '/airline-logos/sprite.393ffe7a04.svg#logo-kenyaairways' },
+    { pattern: /ethiopian/i, code: 'ET', name: 'Ethiopian Airlines', logo: '/airline-logos/sprite.393ffe7a04.svg#logo-ethiopianairlines' },
+    { pattern: /turkish/i, code: 'TK', name: 'Turkish Airlines', logo: '/airline-logos/sprite.393ffe7a04.svg#logo-turkishairlines' },
     { pattern: /honeymoon|holiday|zanzibar|escape|package|safari/i, code: 'HG', name: 'Holiday Package', logo: '/favicon.jpeg' },
   ];
 
@@ -712,6 +712,46 @@
     return 'https://wa.me/' + supportWhatsappNumber + '?text=' + encodeURIComponent(message);
   }
 
+  var SVG_NS = 'http://www.w3.org/2000/svg';
+
+  // Airline logos are <symbol>s in one sprite (scripts/build_logo_sprite.py). It is fetched
+  // once and inlined, then every card draws its logo with <use href="#logo-...">.
+  function loadLogoSprite(url) {
+    window.__vukaLogoSprites = window.__vukaLogoSprites || {};
+    if (window.__vukaLogoSprites[url]) {
+      return window.__vukaLogoSprites[url];
+    }
+
+    window.__vukaLogoSprites[url] = fetch(url, { credentials: 'omit' })
+      .then(function (res) {
+        if (!res.ok) throw new Error('logos ' + res.status);
+        return res.text();
+      })
+      .then(function (markup) {
+        var holder = document.createElement('div');
+        holder.innerHTML = markup;
+        var sprite = holder.querySelector('svg');
+        if (!sprite) throw new Error('logos markup');
+        sprite.setAttribute('aria-hidden', 'true');
+        // Not display:none, which stops gradients inside the symbols from painting in Chrome.
+        sprite.style.cssText = 'position:absolute;width:0;height:0;overflow:hidden';
+        document.body.insertBefore(sprite, document.body.firstChild);
+      });
+    return window.__vukaLogoSprites[url];
+  }
+
+  function createSpriteLogo(url, symbolId, label) {
+    var svg = document.createElementNS(SVG_NS, 'svg');
+    svg.setAttribute('class', 'ticket-logo__img');
+    svg.setAttribute('role', 'img');
+    svg.setAttribute('aria-label', label);
+    var use = document.createElementNS(SVG_NS, 'use');
+    use.setAttribute('href', '#' + symbolId);
+    use.setAttributeNS('http://www.w3.org/1999/xlink', 'xlink:href', '#' + symbolId);
+    svg.appendChild(use);
+    return svg;
+  }
+
   function decorateFareItem(item) {
     if (!item || item.getAttribute('data-ticket-enhanced') === '1') {
       return;
@@ -734,18 +774,23 @@
     logo.className = 'ticket-logo';
     logo.setAttribute('data-airline', airlineInfo.code);
 
-    var logoImg = document.createElement('img');
-    logoImg.className = 'ticket-logo__img';
-    logoImg.alt = airlineInfo.name + ' logo';
-
     var logoFallback = document.createElement('span');
     logoFallback.className = 'ticket-logo__fallback';
     logoFallback.textContent = airlineInfo.code;
 
-    logo.appendChild(logoImg);
-    logo.appendChild(logoFallback);
-
-    if (airlineInfo.logo) {
+    var spriteRef = (airlineInfo.logo || '').split('#');
+    if (spriteRef[1]) {
+      logo.appendChild(createSpriteLogo(spriteRef[0], spriteRef[1], airlineInfo.name + ' logo'));
+      logo.appendChild(logoFallback);
+      loadLogoSprite(spriteRef[0]).then(function () {
+        logo.classList.add('ticket-logo--loaded');
+      }, function () { /* keep the airline code fallback */ });
+    } else if (airlineInfo.logo) {
+      var logoImg = document.createElement('img');
+      logoImg.className = 'ticket-logo__img';
+      logoImg.alt = airlineInfo.name + ' logo';
+      logo.appendChild(logoImg);
+      logo.appendChild(logoFallback);
       logoImg.addEventListener('load', function () {
         logo.classList.add('ticket-logo--loaded');
       });
@@ -753,6 +798,8 @@
         logo.classList.remove('ticket-logo--loaded');
       });
       logoImg.src = airlineInfo.logo;
+    } else {
+      logo.appendChild(logoFallback);
     }
 
     var airlineText = document.createElement('div');
@@ -915,6 +962,325 @@
     decorateFareItem(item);
   });
 
+  // Live prices: /fares.json (scripts/build_fares_index.py) holds every card's price by route key,
+  // so a price change ships as one small file. Baked-in HTML prices stay as the no-JS fallback.
+  var FARES_URL = '/fares.json';
+  var FARES_CACHE_KEY = 'vuka:fares';
+  var FARES_TTL_MS = 15 * 60 * 1000;
+
+  function currentPageSlug() {
+    return window.location.pathname.replace(/index\.html$/, '').replace(/^\/+|\/+$/g, '');
+  }
+
+  function loadFaresIndex() {
+    if (window.__vukaFares) {
+      return window.__vukaFares;
+    }
+
+    var cached = null;
+    try {
+      cached = JSON.parse(window.localStorage.getItem(FARES_CACHE_KEY) || 'null');
+    } catch (error) {
+      cached = null;
+    }
+
+    if (cached && cached.data && Date.now() - cached.at < FARES_TTL_MS) {
+      window.__vukaFares = Promise.resolve(cached.data);
+      return window.__vukaFares;
+    }
+
+    window.__vukaFares = fetch(FARES_URL, { credentials: 'omit' })
+      .then(function (res) {
+        if (!res.ok) throw new Error('fares ' + res.status);
+        return res.json();
+      })
+      .then(function (data) {
+        if (!data || data.version !== 1) throw new Error('fares version');
+        try {
+          window.localStorage.setItem(FARES_CACHE_KEY, JSON.stringify({ at: Date.now(), data: data }));
+        } catch (error) { /* storage full or disabled */ }
+        return data;
+      })
+      .catch(function () {
+        return cached ? cached.data : null;
+      });
+    return window.__vukaFares;
+  }
+
+  function hydrateFareItem(item, row, fields) {
+    var price = row[fields.price];
+    if (typeof price !== 'number') return;
+
+    var priceText = 'GBP ' + price;
+    var strong = item.querySelector('[data-price]') || item.querySelector('.fare-price strong');
+    if (strong && cleanText(strong.textContent) !== priceText) {
+      strong.textContent = priceText;
+    }
+    item.setAttribute('data-price-gbp', String(price));
+    if (row[fields.tier]) {
+      item.setAttribute('data-fare-tier', row[fields.tier]);
+    }
+
+    // The WhatsApp text was built from the baked-in price.
+    var selectBtn = item.querySelector('.select-fare-btn');
+    var whatsappLink = item.querySelector('.fare-quick--wa');
+    if (selectBtn && whatsappLink) {
+      whatsappLink.href = buildWhatsappHref(collectFareFromRow(selectBtn));
+    }
+  }
+
+  function hydrateFares() {
+    var items = Array.prototype.slice.call(document.querySelectorAll('.fare-item[data-route-key]'));
+    if (!items.length || !window.fetch) return;
+
+    var slug = currentPageSlug();
+    loadFaresIndex().then(function (data) {
+      if (!data || !data.routes) return;
+
+      var fields = {};
+      data.fields.forEach(function (name, i) { fields[name] = i; });
+
+      // Cards are matched by (route key, occurrence on this page), the same n the index was built with.
+      var seen = {};
+      items.forEach(function (item) {
+        var key = item.getAttribute('data-route-key');
+        var n = seen[key] || 0;
+        seen[key] = n + 1;
+
+        var rows = data.routes[key] || [];
+        for (var i = 0; i < rows.length; i++) {
+          if (rows[i][fields.page] === slug && rows[i][fields.n] === n) {
+            hydrateFareItem(item, rows[i], fields);
+            return;
+          }
+        }
+      });
+    });
+  }
+
+  hydrateFares();
+
+  // Route finder: /route-index.json (scripts/build_route_index.py) is searched in the browser, so
+  // "manc lagos" or "lhr acc" resolve without a server round trip. Fetched on first focus only.
+  var ROUTES_URL = '/route-index.json';
+  var ROUTES_CACHE_KEY = 'vuka:routes';
+  var ROUTES_TTL_MS = 60 * 60 * 1000;
+  var ROUTE_STOPWORDS = { flights: 1, flight: 1, cheap: 1, from: 1, to: 1, uk: 1, the: 1, deals: 1, holiday: 1, holidays: 1, packages: 1 };
+
+  function decodeIds(text) {
+    var ids = [];
+    (text || '').split('.').forEach(function (part) {
+      if (!part) return;
+      var range = part.split('-');
+      var from = parseInt(range[0], 36);
+      var to = range.length > 1 ? parseInt(range[1], 36) : from;
+      for (var i = from; i <= to; i++) ids.push(i);
+    });
+    return ids;
+  }
+
+  function placeSlug(name) {
+    return String(name || '').toLowerCase()
+      .normalize('NFKD').replace(/[\u0300-\u036f]/g, '')
+      .replace(/[^a-z0-9\s-]/g, '').trim()
+      .replace(/[\s_-]+/g, '-');
+  }
+
+  function prepareRouteIndex(data) {
+    var pages = [];
+    var origins = {};
+    data.pages.forEach(function (row) {
+      if (row[1] >= 0) origins[row[1]] = true;
+      decodeIds(row[2]).forEach(function (dest) {
+        pages.push({ pattern: row[0], origin: row[1], dest: dest });
+      });
+    });
+    return { places: data.places, patterns: data.patterns, pages: pages, origins: origins, words: data.words, tri: data.tri };
+  }
+
+  function loadRouteIndex() {
+    if (window.__vukaRoutes) {
+      return window.__vukaRoutes;
+    }
+
+    var cached = null;
+    try {
+      cached = JSON.parse(window.localStorage.getItem(ROUTES_CACHE_KEY) || 'null');
+    } catch (error) {
+      cached = null;
+    }
+
+    if (cached && cached.data && Date.now() - cached.at < ROUTES_TTL_MS) {
+      window.__vukaRoutes = Promise.resolve(prepareRouteIndex(cached.data));
+      return window.__vukaRoutes;
+    }
+
+    window.__vukaRoutes = fetch(ROUTES_URL, { credentials: 'omit' })
+      .then(function (res) {
+        if (!res.ok) throw new Error('routes ' + res.status);
+        return res.json();
+      })
+      .then(function (data) {
+        if (!data || data.version !== 1) throw new Error('routes version');
+        try {
+          window.localStorage.setItem(ROUTES_CACHE_KEY, JSON.stringify({ at: Date.now(), data: data }));
+        } catch (error) { /* storage full or disabled */ }
+        return prepareRouteIndex(data);
+      })
+      .catch(function () {
+        window.__vukaRoutes = null;
+        return cached ? prepareRouteIndex(cached.data) : null;
+      });
+    return window.__vukaRoutes;
+  }
+
+  function placesForToken(index, token) {
+    var words = index.words;
+    var found = {};
+    var any = false;
+
+    // Binary search for the first word >= token (words is [word, placeId, word, placeId, ...]).
+    var lo = 0;
+    var hi = words.length / 2;
+    while (lo < hi) {
+      var mid = (lo + hi) >> 1;
+      if (words[mid * 2] < token) lo = mid + 1; else hi = mid;
+    }
+    for (var i = lo; i < words.length / 2 && words[i * 2].indexOf(token) === 0; i++) {
+      found[words[i * 2 + 1]] = true;
+      any = true;
+    }
+    if (any || token.length < 3) {
+      return found;
+    }
+
+    // Typo fallback: places sharing at least half of the token's leading-anchored trigrams.
+    var padded = ' ' + token;
+    var grams = [];
+    for (var g = 0; g + 3 <= padded.length; g++) grams.push(padded.slice(g, g + 3));
+    var hits = {};
+    grams.forEach(function (gram) {
+      decodeIds(index.tri[gram]).forEach(function (id) {
+        hits[id] = (hits[id] || 0) + 1;
+      });
+    });
+    Object.keys(hits).forEach(function (id) {
+      if (hits[id] * 2 >= grams.length) found[id] = true;
+    });
+    return found;
+  }
+
+  function searchRoutes(index, query, limit) {
+    var tokens = String(query || '').toLowerCase().split(/[^a-z0-9]+/).filter(function (t) {
+      return t && !ROUTE_STOPWORDS[t];
+    });
+    if (!tokens.length) return [];
+
+    var sets = tokens.map(function (token) { return placesForToken(index, token); });
+    var here = currentPageSlug();
+    var results = [];
+
+    function isUkOrigin(set) {
+      for (var id in set) if (index.origins[id]) return true;
+      return false;
+    }
+
+    index.pages.forEach(function (page) {
+      var score = 0;
+      for (var i = 0; i < sets.length; i++) {
+        // "From UK" pages cover every UK origin, so "manc lagos" still finds flights-to-lagos-from-uk,
+        // but only as a fallback: an exact origin match scores higher than the UK-wide wildcard.
+        var asOrigin = page.origin >= 0 ? !!sets[i][page.origin] : isUkOrigin(sets[i]);
+        var asDest = !!sets[i][page.dest];
+        if (!asOrigin && !asDest) continue;
+        score += asDest || page.origin >= 0 ? 2 : 1;
+        // First token reads as the origin, the last as the destination.
+        if (sets.length > 1 && ((i === 0 && asOrigin) || (i === sets.length - 1 && asDest))) score += 1;
+      }
+      if (!score) return;
+      // A lone destination ("lagos") prefers the page covering every UK airport.
+      if (sets.length === 1 && page.origin < 0 && sets[0][page.dest]) score += 0.5;
+
+      var pattern = index.patterns[page.pattern];
+      var origin = page.origin >= 0 ? index.places[page.origin] : '';
+      var dest = index.places[page.dest];
+      var slug = pattern[0].replace('{o}', placeSlug(origin)).replace('{d}', placeSlug(dest));
+      if (slug === here) return;
+
+      results.push({
+        href: '/' + slug + '/',
+        label: pattern[1].replace('{O}', origin).replace('{D}', dest),
+        score: score,
+      });
+    });
+
+    results.sort(function (a, b) { return b.score - a.score || a.label.localeCompare(b.label); });
+    return results.slice(0, limit || 8);
+  }
+
+  // Console/other scripts: window.vukaFindRoutes('manc lagos').then(console.log)
+  window.vukaFindRoutes = function (query, limit) {
+    return Promise.resolve(loadRouteIndex()).then(function (index) {
+      return index ? searchRoutes(index, query, limit) : [];
+    });
+  };
+
+  function bindRouteFinder(input) {
+    var list = input.parentNode.querySelector('.route-finder__results');
+    if (!list) {
+      list = document.createElement('ul');
+      list.className = 'route-finder__results';
+      input.parentNode.appendChild(list);
+    }
+    list.hidden = true;
+
+    function render(results) {
+      list.innerHTML = '';
+      results.forEach(function (r) {
+        var li = document.createElement('li');
+        var a = document.createElement('a');
+        a.href = r.href;
+        a.textContent = r.label;
+        li.appendChild(a);
+        list.appendChild(li);
+      });
+      list.hidden = !results.length;
+    }
+
+    input.addEventListener('focus', function () { loadRouteIndex(); });
+    input.addEventListener('input', function () {
+      var query = input.value;
+      window.vukaFindRoutes(query).then(function (results) {
+        if (input.value === query) render(results);
+      });
+    });
+    input.addEventListener('keydown', function (event) {
+      if (event.key === 'Enter') {
+        var first = list.querySelector('a');
+        if (first) {
+          event.preventDefault();
+          window.location.href = first.getAttribute('href');
+        }
+      } else if (event.key === 'Escape') {
+        list.hidden = true;
+      }
+    });
+  }
+
+  (function initRouteFinder() {
+    if (!window.fetch) return;
+    var summary = document.querySelector('.search-summary');
+    if (summary && !document.querySelector('[data-route-search]')) {
+      summary.insertAdjacentHTML('beforebegin', [
+        '<div class="route-finder">',
+        '  <label class="route-finder__label" for="route-finder-input">Looking for another route?</label>',
+        '  <input class="route-finder__input" id="route-finder-input" type="search" autocomplete="off" placeholder="e.g. Manchester to Lagos" data-route-search />',
+        '</div>',
+      ].join(''));
+    }
+    Array.prototype.slice.call(document.querySelectorAll('[data-route-search]')).forEach(bindRouteFinder);
+  })();
+
   function showTicketProcessedToast(text) {
     var existing = document.getElementById('ticket-toast');
     if (existing) existing.remove();
@@ -0,0 +1,273 @@
+"""Per-page weight audit for landing pages, with budgets and a baseline.
+
+Why:
+- The generators (sheet sync, fill, migrations) keep adding markup to every
+  page. Nothing tells us when a page quietly doubles in size.
+
+What it does:
+- For each <root>/*/index.html (root is public/ or dist/)
+- Measures HTML bytes, the inlined AUTO_SEO block, referenced local CSS/JS,
+  airline logos the fare cards will load, and the number of fare cards
+- Compares every page against scripts/page-budgets.json and against the last
+  baseline (scripts/page-weight-baseline.json)
+- Writes a JSON + Markdown report (heaviest pages, growth since baseline)
+- Exits 1 when any page breaks a budget or grows past the allowed percentage
+
+Run:
+  python scripts/audit_page_weight.py                  # audit public/
+  python scripts/audit_page_weight.py --root dist      # audit the build output
+  python scripts/audit_page_weight.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PUBLIC_DIR = REPO_ROOT / "public"
+BUDGETS_JSON = REPO_ROOT / "scripts" / "page-budgets.json"
+BASELINE_JSON = REPO_ROOT / "scripts" / "page-weight-baseline.json"
+REPORT_DIR = REPO_ROOT / "reports"
+
+AUTO_START = "<!-- AUTO_SEO_START -->"
+AUTO_END = "<!-- AUTO_SEO_END -->"
+
+DEFAULT_BUDGETS = {
+    "html_bytes": 48_000,
+    "seo_block_bytes": 32_000,
+    "asset_requests": 14,
+    "asset_bytes": 320_000,
+    "total_bytes": 360_000,
+    "fare_cards": 12,
+    # Allowed growth of total_bytes vs baseline before a page counts as a regression.
+    "growth_pct": 10,
+}
+
+# Metrics compared against budgets (everything except growth_pct).
+BUDGETED = ["html_bytes", "seo_block_bytes", "asset_requests", "asset_bytes", "total_bytes", "fare_cards"]
+
+_AIRLINE_RULE_RE = re.compile(r"\{\s*pattern:\s*/(.+?)/(i?),[^}]*?logo:\s*'([^']+)'")
+
+
+def _local_path(root: Path, page_dir: Path, ref: str) -> Path | None:
+    ref = ref.split("#", 1)[0].split("?", 1)[0]
+    if not ref or re.match(r"^(?:[a-z]+:)?//", ref) or ref.startswith(("data:", "mailto:", "tel:")):
+        return None
+    return (root / ref.lstrip("/")) if ref.startswith("/") else (page_dir / ref)
+
+
+def _airline_rules(js_text: str) -> list[tuple[re.Pattern, str]]:
+    # Mirrors airlineRules in landing-pages*.js: the first matching pattern decides the logo.
+    rules = []
+    for pattern, flags, logo in _AIRLINE_RULE_RE.findall(js_text):
+        rules.append((re.compile(pattern, re.IGNORECASE if flags else 0), logo))
+    return rules
+
+
+def measure_page(root: Path, fp: Path, _js_cache: dict[Path, str] | None = None) -> dict:
+    js_cache = _js_cache if _js_cache is not None else {}
+    html = fp.read_text(encoding="utf-8")
+    page_dir = fp.parent
+
+    seo = 0
+    m = re.search(re.escape(AUTO_START) + r".*?" + re.escape(AUTO_END), html, flags=re.DOTALL)
+    if m:
+        seo = len(m.group(0).encode("utf-8"))
+
+    css = []
+    for tag in re.findall(r"<link\b[^>]*>", html):
+        href = re.search(r"href=\"([^\"]+)\"", tag)
+        if href and re.search(r"rel=\"stylesheet\"", tag):
+            css.append(href.group(1))
+    js = re.findall(r"<script\b[^>]*src=\"([^\"]+)\"", html)
+    imgs = re.findall(r"<img\b[^>]*src=\"([^\"]+)\"", html)
+
+    assets: dict[str, int] = {}
+    missing: list[str] = []
+
+    def add(ref: str) -> Path | None:
+        p = _local_path(root, page_dir, ref)
+        if p is None:
+            return None
+        if p.exists():
+            assets[ref] = p.stat().st_size
+        else:
+            assets[ref] = 0
+            missing.append(ref)
+        return p
+
+    for ref in css + imgs:
+        add(ref)
+
+    # Logos are injected by the landing-page script from each fare title.
+    titles = re.findall(r"<p class=\"fare-title\">(.*?)</p>", html, flags=re.DOTALL)
+    logos: set[str] = set()
+    for ref in js:
+        p = add(ref)
+        if p is None or not p.exists():
+            continue
+        if p not in js_cache:
+            js_cache[p] = p.read_text(encoding="utf-8")
+        rules = _airline_rules(js_cache[p])
+        for title in titles:
+            for pattern, logo in rules:
+                if pattern.search(title):
+                    # Sprite refs (sprite.<hash>.svg#logo-x) share one request.
+                    logos.add(logo.split("#", 1)[0])
+                    break
+    for logo in sorted(logos):
+        add(logo)
+
+    html_bytes = len(html.encode("utf-8"))
+    asset_bytes = sum(assets.values())
+    return {
+        "page": page_dir.name,
+        "html_bytes": html_bytes,
+        "seo_block_bytes": seo,
+        "css_count": len(css),
+        "js_count": len(js),
+        "logo_count": len(logos),
+        "asset_requests": len(assets),
+        "asset_bytes": asset_bytes,
+        "total_bytes": html_bytes + asset_bytes,
+        "fare_cards": html.count("<article class=\"fare-item\""),
+        "missing_assets": missing,
+    }
+
+
+def audit(root: Path) -> list[dict]:
+    js_cache: dict[Path, str] = {}
+    pages = []
+    for d in sorted(root.iterdir()):
+        fp = d / "index.html"
+        if d.is_dir() and fp.exists():
+            pages.append(measure_page(root, fp, js_cache))
+    return pages
+
+
+def load_budgets(path: Path) -> dict:
+    budgets = dict(DEFAULT_BUDGETS)
+    if path.exists():
+        budgets.update(json.loads(path.read_text(encoding="utf-8")))
+    return budgets
+
+
+def load_baseline(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {p["page"]: p for p in data.get("pages", [])}
+
+
+def find_regressions(pages: list[dict], budgets: dict, baseline: dict[str, dict]) -> list[dict]:
+    out = []
+    growth_pct = float(budgets.get("growth_pct", 0))
+    for p in pages:
+        for metric in BUDGETED:
+            limit = budgets.get(metric)
+            if limit is not None and p[metric] > limit:
+                out.append({"page": p["page"], "metric": metric, "value": p[metric], "limit": limit})
+        prev = baseline.get(p["page"])
+        if prev and growth_pct and prev.get("total_bytes"):
+            grown = (p["total_bytes"] - prev["total_bytes"]) * 100.0 / prev["total_bytes"]
+            if grown > growth_pct:
+                out.append({
+                    "page": p["page"],
+                    "metric": "growth_pct",
+                    "value": round(grown, 1),
+                    "limit": growth_pct,
+                })
+    return out
+
+
+def _kb(n: int) -> str:
+    return f"{n / 1024:.1f} KB"
+
+
+def render_markdown(pages: list[dict], baseline: dict[str, dict], regressions: list[dict], top: int) -> str:
+    lines = ["# Landing page weight report", ""]
+    lines.append(f"Pages audited: {len(pages)}. Regressions: {len(regressions)}.")
+    lines.append("")
+
+    if regressions:
+        lines += ["## Regressions", "", "| Page | Metric | Value | Limit |", "| --- | --- | ---: | ---: |"]
+        for r in regressions:
+            lines.append(f"| {r['page']} | {r['metric']} | {r['value']} | {r['limit']} |")
+        lines.append("")
+
+    lines += [
+        f"## Heaviest {min(top, len(pages))} pages",
+        "",
+        "| Page | Total | HTML | SEO block | Assets (req) | Fare cards | vs baseline |",
+        "| --- | ---: | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    for p in sorted(pages, key=lambda x: x["total_bytes"], reverse=True)[:top]:
+        prev = baseline.get(p["page"])
+        delta = "new" if not prev else f"{p['total_bytes'] - prev['total_bytes']:+d} B"
+        lines.append(
+            f"| {p['page']} | {_kb(p['total_bytes'])} | {_kb(p['html_bytes'])} | {_kb(p['seo_block_bytes'])} "
+            f"| {_kb(p['asset_bytes'])} ({p['asset_requests']}) | {p['fare_cards']} | {delta} |"
+        )
+
+    grown = []
+    for p in pages:
+        prev = baseline.get(p["page"])
+        if prev and p["total_bytes"] != prev["total_bytes"]:
+            grown.append((p["total_bytes"] - prev["total_bytes"], p["page"]))
+    if grown:
+        lines += ["", "## Growth since baseline", "", "| Page | Change |", "| --- | ---: |"]
+        for delta, page in sorted(grown, reverse=True)[:top]:
+            lines.append(f"| {page} | {delta:+d} B |")
+
+    missing = sorted({(p["page"], ref) for p in pages for ref in p["missing_assets"]})
+    if missing:
+        lines += ["", "## Missing local assets", ""]
+        lines += [f"- {page}: `{ref}`" for page, ref in missing]
+
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Audit landing page weight against budgets.")
+    ap.add_argument("--root", type=Path, default=PUBLIC_DIR, help="public/ or dist/ (default: public/)")
+    ap.add_argument("--budgets", type=Path, default=BUDGETS_JSON)
+    ap.add_argument("--baseline", type=Path, default=BASELINE_JSON)
+    ap.add_argument("--out", type=Path, default=REPORT_DIR, help="Directory for page-weight.json/.md")
+    ap.add_argument("--top", type=int, default=15, help="Rows in the heaviest/growth tables")
+    ap.add_argument("--update-baseline", action="store_true", help="Write the current measurements as the new baseline")
+    args = ap.parse_args(argv)
+
+    if not args.root.exists():
+        print(f"{args.root} not found")
+        return 2
+
+    pages = audit(args.root)
+    budgets = load_budgets(args.budgets)
+    baseline = load_baseline(args.baseline)
+    regressions = find_regressions(pages, budgets, baseline)
+
+    report = {
+        "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+        "root": str(args.root),
+        "budgets": budgets,
+        "regressions": regressions,
+        "pages": pages,
+    }
+    args.out.mkdir(parents=True, exist_ok=True)
+    (args.out / "page-weight.json").write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    (args.out / "page-weight.md").write_text(render_markdown(pages, baseline, regressions, args.top), encoding="utf-8")
+
+    if args.update_baseline:
+        snapshot = {"generated": report["generated"], "pages": [{k: v for k, v in p.items() if k != "missing_assets"} for p in pages]}
+        args.baseline.write_text(json.dumps(snapshot, indent=2) + "\n", encoding="utf-8")
+
+    print("OK" if not regressions else "FAIL", {"pages": len(pages), "regressions": len(regressions), "report": str(args.out)})
+    return 1 if regressions and not args.update_baseline else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
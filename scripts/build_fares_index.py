@@ -0,0 +1,170 @@
+"""Build public/fares.json: every fare card's price, indexed by route.
+
+Why:
+- Fare prices are baked into each page (data-price-gbp and the visible
+  <strong data-price>GBP n</strong>), so one price change meant rewriting and
+  redeploying every page that shows the route.
+
+What it does:
+- Reads every <article class="fare-item"> that has a data-route-key
+  (see scripts/migrate_fare_data_attrs.py) across public/*/index.html
+- Writes one compact, versioned JSON file with an array per route key:
+    {"version": 1, "rev": "<content hash>", "currency": "GBP",
+     "fields": ["page", "n", "tier", "price"],
+     "routes": {"LHR-ACC": [["cheap-flights-from-london-to-accra", 0, "low", 399], ...]}}
+  where n is the card's occurrence of that route on the page and price is
+  null for "Get a quote" cards
+- Prices already in fares.json win over the HTML, so a price change is an edit
+  to this one file; landing-pages.js fetches it once, caches it and hydrates
+  the cards. New cards are added from the HTML and removed cards are dropped.
+  --from-pages discards the edited prices and re-reads them from the HTML.
+
+Run:
+  python scripts/vuka.py fares [--from-pages] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+from pathlib import Path
+
+import pipeline
+
+VERSION = 1
+FIELDS = ["page", "n", "tier", "price"]
+
+# The migration writes this for a code it could not read off the card ("LHR to XXX").
+PLACEHOLDER_IATA = "XXX"
+
+ARTICLE_RE = re.compile(r"<article class=\"fare-item\"([^>]*)>([\s\S]*?)</article>")
+ATTR_RE = re.compile(r"(data-[a-z-]+)=\"([^\"]*)\"")
+
+
+def extract_fare_cards(html: str, page: str) -> list[dict]:
+    """Fare cards with a route key, in page order."""
+    cards = []
+    seen: dict[str, int] = {}
+    for m in ARTICLE_RE.finditer(html):
+        attrs = dict(ATTR_RE.findall(m.group(1)))
+        key = attrs.get("data-route-key")
+        if not key:
+            continue
+        price = attrs.get("data-price-gbp")
+        cards.append(
+            {
+                "route": key,
+                "page": page,
+                "n": seen.get(key, 0),
+                "origin": attrs.get("data-origin", ""),
+                "dest": attrs.get("data-dest", ""),
+                "tier": attrs.get("data-fare-tier", ""),
+                "price": int(price) if price and price.isdigit() else None,
+                "start": m.start(),
+                "end": m.end(),
+            }
+        )
+        seen[key] = seen.get(key, 0) + 1
+    return cards
+
+
+def known_code(code: str | None) -> bool:
+    return bool(code) and code != PLACEHOLDER_IATA
+
+
+def collect_cards(public: Path) -> list[dict]:
+    cards = []
+    for fp in sorted(public.glob("*/index.html")):
+        cards.extend(extract_fare_cards(fp.read_text(encoding="utf-8"), fp.parent.name))
+    return cards
+
+
+def load_index(fp: Path) -> dict:
+    if not fp.exists():
+        return {}
+    data = json.loads(fp.read_text(encoding="utf-8"))
+    if data.get("version") != VERSION:
+        return {}
+    return data
+
+
+def index_prices(index: dict) -> dict[tuple[str, str, int], int | None]:
+    """(route key, page, n) -> price from a loaded fares.json."""
+    if not index:
+        return {}
+    at = {name: i for i, name in enumerate(index["fields"])}
+    return {
+        (key, row[at["page"]], row[at["n"]]): row[at["price"]]
+        for key, rows in index["routes"].items()
+        for row in rows
+    }
+
+
+def build_index(cards: list[dict], previous: dict | None = None) -> tuple[dict, int]:
+    """Returns (index, number of cards whose HTML price differs from the kept index price)."""
+    kept = index_prices(previous or {})
+
+    routes: dict[str, list] = {}
+    stale_html = 0
+    for c in cards:
+        price = c["price"]
+        ident = (c["route"], c["page"], c["n"])
+        if ident in kept:
+            if kept[ident] != price:
+                stale_html += 1
+            price = kept[ident]
+        routes.setdefault(c["route"], []).append([c["page"], c["n"], c["tier"], price])
+
+    routes = {key: sorted(rows, key=lambda r: (r[0], r[1])) for key, rows in sorted(routes.items())}
+    body = json.dumps(routes, separators=(",", ":"), sort_keys=True)
+    index = {
+        "version": VERSION,
+        "rev": hashlib.sha256(body.encode("utf-8")).hexdigest()[:12],
+        "currency": "GBP",
+        "fields": FIELDS,
+        "routes": routes,
+    }
+    return index, stale_html
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Build the route fare index (public/fares.json).")
+    ap.add_argument("--from-pages", action="store_true", help="Ignore prices in the existing index and take them from the HTML")
+    ap.add_argument("--check", action="store_true", help="Exit 1 if fares.json is out of date instead of writing it")
+    args = ap.parse_args(argv)
+
+    public = pipeline.path("PUBLIC_DIR")
+    out = pipeline.path("FARES_JSON")
+    previous = load_index(out)
+    cards = collect_cards(public)
+    index, stale_html = build_index(cards, None if args.from_pages else previous)
+
+    if args.check:
+        if previous.get("rev") != index["rev"]:
+            print(f"{out} is out of date (rev {previous.get('rev')} -> {index['rev']})")
+            return 1
+        print("OK", {"rev": index["rev"]})
+        return 0
+
+    text = json.dumps(index, separators=(",", ":")) + "\n"
+    if not out.exists() or out.read_text(encoding="utf-8") != text:
+        out.write_text(text, encoding="utf-8")
+
+    print(
+        "OK",
+        {
+            "rev": index["rev"],
+            "routes": len(index["routes"]),
+            "cards": len(cards),
+            "priced": sum(1 for c in cards if c["price"] is not None),
+            "html_behind_index": stale_html,
+            "bytes": len(text.encode("utf-8")),
+        },
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,362 @@
+"""Build the airline-logo sprite the fare cards render their logos from.
+
+Why:
+- landing-pages.js gave every airline on a page its own <img> request to
+  public/airline-logos/*.svg, and those files are editor exports (Inkscape
+  metadata, namedview blocks, 8-digit coordinates): about 100 KB together.
+
+What it does:
+- Minifies each logo SVG with the standard library only: drops metadata,
+  editor namespaces, comments, unreferenced ids and style properties that
+  restate an inherited or initial value; rounds coordinates (--precision
+  decimals); unwraps attribute-less groups and empty <defs>
+- Turns each logo into a <symbol id="logo-<name>"> with the logo's viewBox
+  and prefixes the ids inside it (gradients, clip paths) so symbols cannot
+  collide with each other or with the page
+- Writes one content-hashed sprite, public/airline-logos/sprite.<hash>.svg,
+  and removes older sprites
+- Rewrites the airlineRules logo references to
+  /airline-logos/sprite.<hash>.svg#logo-<name> in public/landing-pages.js and
+  in the versioned bundle(s) the pages load (landing-pages.vNN-*.js). The
+  script fetches the sprite once, inlines it and draws every card's logo with
+  <use>, so a page costs one logo request however many airlines it shows.
+- Refuses to run (and --check fails) while pages still load a bundle cut
+  before the sprite renderer existed: an <img> cannot draw a sprite symbol,
+  so cut a new bundle from landing-pages.js and point the pages at it first.
+
+The source SVGs stay in public/airline-logos/ as the editable originals.
+
+Run:
+  python scripts/vuka.py logos
+  python scripts/vuka.py logos --check      # exit 1 if the sprite or a loaded bundle is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import xml.etree.ElementTree as ET
+from html import escape
+from pathlib import Path
+
+import pipeline
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+SPRITE_GLOB = "sprite.*.svg"
+# Only bundles containing this function can draw <use> logos from the sprite.
+SPRITE_RENDERER = "function loadLogoSprite("
+SYMBOL_PREFIX = "logo-"
+PRECISION = 2
+
+# Elements with no rendering effect.
+DROP_TAGS = {"metadata", "title", "desc"}
+# Root <svg> attributes that do not carry over to a <symbol>.
+ROOT_ONLY_ATTRS = {"width", "height", "x", "y", "version", "baseProfile", "viewBox", "enable-background", "id"}
+NUMERIC_ATTRS = {"x", "y", "width", "height", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx", "ry", "fx", "fy", "stroke-width"}
+
+# Inherited properties and their initial values: a declaration equal to what the element would inherit is dropped.
+INHERITED_DEFAULTS = {
+    "fill": "#000000",
+    "fill-opacity": "1",
+    "fill-rule": "nonzero",
+    "clip-rule": "nonzero",
+    "stroke": "none",
+    "stroke-width": "1",
+    "stroke-opacity": "1",
+    "stroke-linecap": "butt",
+    "stroke-linejoin": "miter",
+    "stroke-miterlimit": "4",
+    "stroke-dasharray": "none",
+    "stroke-dashoffset": "0",
+    "marker": "none",
+    "marker-start": "none",
+    "marker-mid": "none",
+    "marker-end": "none",
+    "visibility": "visible",
+}
+# Not inherited, so the initial value is always safe to drop.
+INITIAL_VALUES = {"opacity": "1", "display": "inline", "overflow": "visible", "enable-background": "accumulate"}
+# Text-only properties Inkscape writes onto every shape.
+TEXT_PROPS = re.compile(r"^(?:font|line-height|letter-spacing|word-spacing|writing-mode|text-|direction|baseline-shift|-inkscape|inkscape)")
+SHAPES = {"path", "rect", "circle", "ellipse", "line", "polyline", "polygon"}
+
+_NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_PATH_TOKEN_RE = re.compile(r"[A-Za-z]|" + _NUMBER_RE.pattern)
+_REF_RE = re.compile(r"url\(\s*['\"]?#([^)'\"]+)['\"]?\s*\)")
+_BUNDLE_RE = re.compile(r"<script\b[^>]*\bsrc=\"/(landing-pages[^\"/]*\.js)\"")
+_LOGO_REF_RE = re.compile(r"(logo:\s*')/airline-logos/(?:([\w-]+)\.svg|sprite\.\w+\.svg#" + SYMBOL_PREFIX + r"([\w-]+))(')")
+
+
+def _local(tag: str) -> tuple[str | None, str]:
+    if tag.startswith("{"):
+        ns, name = tag[1:].split("}", 1)
+        return ns, name
+    return None, tag
+
+
+def _fmt(value: float, precision: int) -> str:
+    s = f"{value:.{precision}f}".rstrip("0").rstrip(".")
+    if s in ("", "-0"):
+        return "0"
+    if s.startswith("0."):
+        return s[1:]
+    if s.startswith("-0."):
+        return "-" + s[2:]
+    return s
+
+
+def minify_path(d: str, precision: int) -> str:
+    # Arc flags may be written without separators ("011"); leave arcs alone rather than misread them.
+    if re.search(r"[Aa]", d):
+        return " ".join(d.split())
+    out: list[str] = []
+    prev_number = False
+    for tok in _PATH_TOKEN_RE.findall(d):
+        if tok.isalpha():
+            out.append(tok)
+            prev_number = False
+            continue
+        num = _fmt(float(tok), precision)
+        if prev_number and not num.startswith("-") and not (num.startswith(".") and "." in out[-1]):
+            out.append(" ")
+        out.append(num)
+        prev_number = True
+    return "".join(out)
+
+
+def minify_numbers(value: str, precision: int) -> str:
+    return " ".join(_fmt(float(n), precision) for n in _NUMBER_RE.findall(value))
+
+
+def minify_transform(value: str) -> str:
+    # Scale factors multiply every coordinate below them, so keep significant digits, not decimals.
+    return re.sub(r"\s*,\s*|\s+", ",", _NUMBER_RE.sub(lambda m: f"{float(m.group(0)):.6g}", value.strip())).replace("(,", "(").replace(",)", ")")
+
+
+def parse_style(style: str) -> dict[str, str]:
+    props = {}
+    for decl in style.split(";"):
+        if ":" in decl:
+            k, v = decl.split(":", 1)
+            props[k.strip()] = v.strip()
+    return props
+
+
+def _length(value: str | None) -> float | None:
+    m = _NUMBER_RE.match((value or "").strip())
+    return float(m.group(0)) if m else None
+
+
+def view_box(root: ET.Element) -> str:
+    if root.get("viewBox"):
+        return minify_numbers(root.get("viewBox"), 4)
+    w, h = _length(root.get("width")), _length(root.get("height"))
+    if not w or not h:
+        raise ValueError("logo has neither a viewBox nor a numeric width/height")
+    return f"0 0 {_fmt(w, 4)} {_fmt(h, 4)}"
+
+
+def referenced_ids(root: ET.Element) -> set[str]:
+    refs: set[str] = set()
+    for el in root.iter():
+        for k, v in el.attrib.items():
+            refs.update(_REF_RE.findall(v))
+            if _local(k)[1] == "href" and v.startswith("#"):
+                refs.add(v[1:])
+    return refs
+
+
+def _clean(el: ET.Element, inherited: dict[str, str], id_map: dict[str, str], precision: int, strip_text: bool) -> None:
+    attrs: dict[str, str] = {}
+    for k, v in el.attrib.items():
+        ns, name = _local(k)
+        if ns == XLINK_NS and name == "href":
+            attrs["href"] = v
+        elif ns is None:
+            attrs[name] = v
+    tag = _local(el.tag)[1]
+
+    # Presentation attributes and style properties resolve the same way here (no stylesheets),
+    # so both are checked against what the element inherits.
+    style = parse_style(attrs.pop("style", ""))
+    own = {k: v for k, v in attrs.items() if k in INHERITED_DEFAULTS or k in INITIAL_VALUES}
+    own.update(style)
+    is_leaf_shape = tag in SHAPES
+    effective = dict(inherited)
+    kept_style = {}
+    for k, v in style.items():
+        if strip_text and TEXT_PROPS.match(k):
+            continue
+        if INITIAL_VALUES.get(k) == v or (k in INHERITED_DEFAULTS and inherited.get(k) == v):
+            continue
+        kept_style[k] = v
+    for k, v in own.items():
+        if k in INHERITED_DEFAULTS:
+            effective[k] = v
+    if is_leaf_shape and effective.get("stroke") == "none":
+        kept_style = {k: v for k, v in kept_style.items() if not k.startswith("stroke-")}
+        for k in [k for k in attrs if k.startswith("stroke-")]:
+            del attrs[k]
+
+    if "id" in attrs:
+        if attrs["id"] in id_map:
+            attrs["id"] = id_map[attrs["id"]]
+        else:
+            del attrs["id"]
+    if tag == "path" and "d" in attrs:
+        attrs["d"] = minify_path(attrs["d"], precision)
+    if tag in ("polygon", "polyline") and "points" in attrs:
+        attrs["points"] = minify_numbers(attrs["points"], precision)
+    if "transform" in attrs:
+        attrs["transform"] = minify_transform(attrs["transform"])
+    for k in NUMERIC_ATTRS & attrs.keys():
+        if _NUMBER_RE.fullmatch(attrs[k].strip()):
+            attrs[k] = _fmt(float(attrs[k]), precision)
+    if kept_style:
+        attrs["style"] = ";".join(f"{k}:{v}" for k, v in kept_style.items())
+
+    def rename(m: re.Match) -> str:
+        return f"url(#{id_map.get(m.group(1), m.group(1))})"
+
+    for k, v in list(attrs.items()):
+        attrs[k] = _REF_RE.sub(rename, v)
+        if k == "href" and v.startswith("#"):
+            attrs[k] = "#" + id_map.get(v[1:], v[1:])
+
+    el.attrib.clear()
+    el.attrib.update(attrs)
+    el.tag = tag
+
+    children = []
+    for child in list(el):
+        ns, name = _local(child.tag) if isinstance(child.tag, str) else ("", "")
+        if ns != SVG_NS or name in DROP_TAGS:
+            continue
+        _clean(child, effective, id_map, precision, strip_text)
+        if child.tag == "defs" and not len(child):
+            continue
+        if el.tag == "defs" and "id" not in child.attrib:
+            continue  # an unreferenced gradient or clip path
+        if child.tag == "g" and not child.attrib:
+            children.extend(child)  # attribute-less group: its children move up
+            continue
+        children.append(child)
+    el[:] = children
+
+
+def serialize(el: ET.Element) -> str:
+    attrs = "".join(f' {k}="{escape(v, quote=True)}"' for k, v in el.attrib.items())
+    inner = escape(el.text.strip(), quote=False) if el.text and el.text.strip() else ""
+    inner += "".join(serialize(child) for child in el)
+    return f"<{el.tag}{attrs}>{inner}</{el.tag}>" if inner else f"<{el.tag}{attrs}/>"
+
+
+def build_symbol(fp: Path, precision: int = PRECISION) -> str:
+    root = ET.fromstring(fp.read_bytes())
+    symbol_id = SYMBOL_PREFIX + fp.stem
+    id_map = {old: f"{symbol_id}-{i}" for i, old in enumerate(sorted(referenced_ids(root)))}
+    vb = view_box(root)
+    for k in list(root.attrib):
+        if _local(k)[1] in ROOT_ONLY_ATTRS:
+            del root.attrib[k]
+    # The symbol inherits from the page's <use>, so only values restated inside the logo are dropped.
+    strip_text = not any(_local(el.tag)[1] in ("text", "tspan") for el in root.iter() if isinstance(el.tag, str))
+    _clean(root, {}, id_map, precision, strip_text)
+    root.tag = "symbol"
+    root.attrib = {"id": symbol_id, "viewBox": vb, **root.attrib}
+    return serialize(root)
+
+
+def build_sprite(logo_dir: Path, precision: int = PRECISION) -> tuple[str, dict[str, int]]:
+    sources = sorted(fp for fp in logo_dir.glob("*.svg") if not fp.match(SPRITE_GLOB))
+    symbols = [build_symbol(fp, precision) for fp in sources]
+    sprite = f'<svg xmlns="{SVG_NS}">' + "".join(symbols) + "</svg>\n"
+    return sprite, {fp.stem: fp.stat().st_size for fp in sources}
+
+
+def rewrite_logo_refs(js: str, sprite_url: str, names: set[str]) -> tuple[str, int]:
+    count = 0
+
+    def repl(m: re.Match) -> str:
+        nonlocal count
+        name = m.group(2) or m.group(3)
+        if name not in names:
+            return m.group(0)
+        count += 1
+        return f"{m.group(1)}{sprite_url}#{SYMBOL_PREFIX}{name}{m.group(4)}"
+
+    return _LOGO_REF_RE.sub(repl, js), count
+
+
+def loaded_bundles(public: Path) -> list[Path]:
+    """The landing-page scripts the pages actually reference."""
+    names: set[str] = set()
+    for fp in public.glob("*/index.html"):
+        names.update(_BUNDLE_RE.findall(fp.read_text(encoding="utf-8")))
+    return [public / name for name in sorted(names)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Minify the airline logos into one content-hashed <symbol> sprite.")
+    ap.add_argument("--precision", type=int, default=PRECISION, help="Decimals kept in path coordinates")
+    ap.add_argument("--check", action="store_true", help="Exit 1 if the sprite or a loaded bundle is out of date")
+    args = ap.parse_args(argv)
+
+    public = pipeline.path("PUBLIC_DIR")
+    logo_dir = public / "airline-logos"
+    bundles = loaded_bundles(public)
+    js_fps = [public / "landing-pages.js"] + [fp for fp in bundles if fp.name != "landing-pages.js"]
+
+    unable = [fp.name for fp in bundles if not fp.exists() or SPRITE_RENDERER not in fp.read_text(encoding="utf-8")]
+    if unable:
+        print(f"Pages load {', '.join(unable)}, which cannot draw sprite logos; cut a new bundle from landing-pages.js and point the pages at it")
+        return 1
+
+    sprite, sources = build_sprite(logo_dir, args.precision)
+    digest = hashlib.sha1(sprite.encode("utf-8")).hexdigest()[:10]
+    sprite_fp = logo_dir / f"sprite.{digest}.svg"
+    sprite_url = f"/airline-logos/{sprite_fp.name}"
+
+    rewritten = {}
+    refs = 0
+    for fp in js_fps:
+        js = fp.read_text(encoding="utf-8")
+        new_js, n = rewrite_logo_refs(js, sprite_url, set(sources))
+        refs += n
+        if new_js != js:
+            rewritten[fp] = new_js
+    stale = [fp for fp in logo_dir.glob(SPRITE_GLOB) if fp != sprite_fp]
+
+    if args.check:
+        outdated = ([] if sprite_fp.exists() else [sprite_fp]) + stale + list(rewritten)
+        if outdated:
+            print("Out of date:", ", ".join(str(fp.relative_to(public)) for fp in outdated))
+            return 1
+        print("OK", {"sprite": sprite_url, "bundles": [fp.name for fp in bundles]})
+        return 0
+
+    if not sprite_fp.exists():
+        sprite_fp.write_text(sprite, encoding="utf-8")
+    for fp in stale:
+        fp.unlink()
+    for fp, new_js in rewritten.items():
+        fp.write_text(new_js, encoding="utf-8")
+
+    print(
+        "OK",
+        {
+            "sprite": sprite_url,
+            "logos": len(sources),
+            "source_bytes": sum(sources.values()),
+            "sprite_bytes": len(sprite.encode("utf-8")),
+            "bundles": [fp.name for fp in bundles],
+            "js_refs": refs,
+        },
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+"""Build public/route-index.json: a compact search index over the landing pages.
+
+Why:
+- Visitors land on one route page and have no quick way to find the page for
+  their own route among the rest of the catalogue.
+
+What it does:
+- Reads the landing pages under public/ (redirect stubs and numbered
+  duplicates skipped), the keywords CSV for place names, and the fare cards'
+  data-origin / data-dest for IATA codes (the migration's "XXX" placeholder
+  is not a code and is skipped)
+- Stores pages as place ids grouped by (pattern, origin) with the
+  destinations as base-36 runs instead of slugs, so a full origin x
+  destination catalogue stays small
+- Emits a sorted word list (place-name words, slug words and IATA codes) that
+  landing-pages.js prefix-searches with a binary search, plus a trigram map
+  for typos, so "manc lagos" or "lhr acc" resolve in the browser without a
+  server round trip
+
+Format (version 1):
+  {"version": 1,
+   "places": ["Accra", "Birmingham", ...],
+   "patterns": [["cheap-flights-from-{o}-to-{d}", "Cheap flights from {O} to {D}"], ...],
+   "pages": [[pattern, origin or -1, "dests"], ...],  dest ids as base-36 runs, e.g. "2.7-c"
+   "words": ["acc", 0, "accra", 0, ...],              sorted, word then place id
+   "tri": {" ac": "2", "gos": "m", ...}}             trigram -> place ids, same encoding
+
+Run:
+  python scripts/vuka.py routes [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+from collections import defaultdict
+
+import pipeline
+
+VERSION = 1
+
+# (slug regex, slug template, label template); {o}/{d} are place slugs, {O}/{D} display names.
+PATTERNS = [
+    (r"cheap-flights-from-(?P<o>.+)-to-(?P<d>.+)", "cheap-flights-from-{o}-to-{d}", "Cheap flights from {O} to {D}"),
+    (r"flights-to-(?P<d>.+)-from-uk", "flights-to-{d}-from-uk", "Flights to {D} from the UK"),
+    (r"flight-deals-to-(?P<d>.+)", "flight-deals-to-{d}", "Flight deals to {D}"),
+    (r"holiday-packages-to-(?P<d>.+)", "holiday-packages-to-{d}", "Holiday packages to {D}"),
+]
+
+ATTR_RE = re.compile(r"<article class=\"fare-item\"[^>]*data-origin=\"([A-Z]{3})\"[^>]*data-dest=\"([A-Z]{3})\"")
+
+
+def place_name(slug: str, names: dict[str, str]) -> str:
+    return names.get(slug) or " ".join(w.capitalize() for w in slug.split("-"))
+
+
+def trigrams(word: str) -> set[str]:
+    padded = f" {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _b36(n: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    out = ""
+    while True:
+        n, r = divmod(n, 36)
+        out = digits[r] + out
+        if not n:
+            return out
+
+
+def encode_ids(ids: list[int]) -> str:
+    # Sorted ids -> "2.7-c": single ids and inclusive runs, base 36, "." separated.
+    parts, i = [], 0
+    while i < len(ids):
+        j = i
+        while j + 1 < len(ids) and ids[j + 1] == ids[j] + 1:
+            j += 1
+        parts.append(_b36(ids[i]) if i == j else f"{_b36(ids[i])}-{_b36(ids[j])}")
+        i = j + 1
+    return ".".join(parts)
+
+
+def collect_pages() -> list[dict]:
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    fares = pipeline.load_stage("build_fares_index")
+    public = pipeline.path("PUBLIC_DIR")
+
+    # Display names from the CSV Location column, keyed by place slug.
+    names: dict[str, str] = {}
+    csv_fp = pipeline.path("KEYWORDS_CSV")
+    if csv_fp.exists():
+        with csv_fp.open("r", encoding="utf-8") as f:
+            for r in csv.DictReader(f):
+                loc = (r.get("Location") or "").strip()
+                if loc:
+                    names[sync.slugify(loc)] = loc
+
+    pages = []
+    for fp in sorted(public.glob("*/index.html")):
+        slug = fp.parent.name
+        if re.search(r"-\d+$", slug) and (public / re.sub(r"-\d+$", "", slug) / "index.html").exists():
+            continue
+        html = fp.read_text(encoding="utf-8")
+        if 'http-equiv="refresh"' in html:
+            continue
+        for i, (rx, _, _) in enumerate(PATTERNS):
+            m = re.fullmatch(rx, slug)
+            if m:
+                break
+        else:
+            continue
+        o, d = m.groupdict().get("o"), m.group("d")
+        codes = ATTR_RE.findall(html)
+        origin_codes = {c[0] for c in codes if fares.known_code(c[0])}
+        dest_codes = {c[1] for c in codes if fares.known_code(c[1])}
+        pages.append(
+            {
+                "pattern": i,
+                "origin": place_name(o, names) if o else None,
+                "dest": place_name(d, names),
+                "origin_codes": sorted(origin_codes) if o else [],
+                "dest_codes": sorted(dest_codes),
+            }
+        )
+    return pages
+
+
+def build_index(pages: list[dict]) -> dict:
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    places = sorted({p["origin"] for p in pages if p["origin"]} | {p["dest"] for p in pages})
+    pid = {name: i for i, name in enumerate(places)}
+
+    words: set[tuple[str, int]] = set()
+    for name, i in pid.items():
+        for w in sync.slugify(name).split("-"):
+            words.add((w, i))
+    for p in pages:
+        if p["origin"]:
+            words.update((c.lower(), pid[p["origin"]]) for c in p["origin_codes"])
+        words.update((c.lower(), pid[p["dest"]]) for c in p["dest_codes"])
+
+    tri: dict[str, set[int]] = defaultdict(set)
+    for w, i in words:
+        if len(w) > 3:  # IATA codes are matched by prefix only
+            for g in trigrams(w):
+                tri[g].add(i)
+
+    grouped: dict[tuple[int, int], set[int]] = defaultdict(set)
+    for p in pages:
+        grouped[(p["pattern"], pid[p["origin"]] if p["origin"] else -1)].add(pid[p["dest"]])
+    return {
+        "version": VERSION,
+        "places": places,
+        "patterns": [[slug_tpl, label_tpl] for _, slug_tpl, label_tpl in PATTERNS],
+        "pages": [[pattern, origin, encode_ids(sorted(dests))] for (pattern, origin), dests in sorted(grouped.items())],
+        "words": [x for w, i in sorted(words) for x in (w, i)],
+        "tri": {g: encode_ids(sorted(ids)) for g, ids in sorted(tri.items())},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Build the client-side route search index.")
+    ap.add_argument("--check", action="store_true", help="Exit 1 if route-index.json is out of date instead of writing it")
+    args = ap.parse_args(argv)
+
+    out = pipeline.path("ROUTE_INDEX_JSON")
+    pages = collect_pages()
+    index = build_index(pages)
+    text = json.dumps(index, separators=(",", ":"), ensure_ascii=False) + "\n"
+    current = out.read_text(encoding="utf-8") if out.exists() else None
+
+    if args.check:
+        if current != text:
+            print(f"{out} is out of date")
+            return 1
+        print("OK", {"pages": len(pages)})
+        return 0
+
+    if current != text:
+        out.write_text(text, encoding="utf-8")
+    print(
+        "OK",
+        {
+            "pages": len(pages),
+            "places": len(index["places"]),
+            "words": len(index["words"]) // 2,
+            "trigrams": len(index["tri"]),
+            "bytes": len(text.encode("utf-8")),
+        },
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
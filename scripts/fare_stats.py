@@ -0,0 +1,224 @@
+"""Route-level fare statistics and price-ranked fare tiers.
+
+Why:
+- scripts/migrate_fare_data_attrs.py sets data-fare-tier by card position
+  (low, mid, high, then other). On cheap-flights-from-london-to-accra that
+  labels GBP 399 "low", 358 "mid" and 312 "high": the tiers run backwards.
+
+What it does:
+- Loads every fare card on the site into NumPy arrays (route, price), using
+  the fares.json price where the index overrides the HTML
+- In one vectorised pass over the route-sorted arrays: per-route count, min,
+  quartiles, median, max and IQR outliers (Tukey fences, --iqr-k). Cards
+  whose origin or dest is missing or the "XXX" placeholder are left out of
+  the route stats: LHR-XXX would pool Dhaka with Islamabad.
+- Tiers each priced card by its price rank among the cards on its page
+  (cheapest third "low", middle "mid", dearest third "high"; equal prices
+  share a tier), so the labels always read in price order where visitors see
+  them. Cards without a price ("Get a quote") are "other".
+- Rewrites data-fare-tier in a single batch, each page read and written once,
+  then refreshes public/fares.json if it exists
+- Writes reports/fare-stats.json and reports/fare-stats.md
+
+Run:
+  python scripts/vuka.py tiers --dry-run
+  python scripts/vuka.py tiers
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+import pipeline
+
+TIERS = np.array(["low", "mid", "high"])
+UNPRICED_TIER = "other"
+
+_TIER_ATTR_RE = re.compile(r"data-fare-tier=\"[^\"]*\"")
+
+
+def load_cards() -> list[dict]:
+    fares = pipeline.load_stage("build_fares_index")
+    cards = fares.collect_cards(pipeline.path("PUBLIC_DIR"))
+    kept = fares.index_prices(fares.load_index(pipeline.path("FARES_JSON")))
+    for c in cards:
+        c["price"] = kept.get((c["route"], c["page"], c["n"]), c["price"])
+    return cards
+
+
+def _prices(cards: list[dict]) -> np.ndarray:
+    return np.array([np.nan if c["price"] is None else c["price"] for c in cards], dtype=float)
+
+
+def rank_tiers(group_id: np.ndarray, price: np.ndarray) -> np.ndarray:
+    """Tier per card from its price rank inside its group (NaN prices get UNPRICED_TIER)."""
+    priced = ~np.isnan(price)
+    order = np.lexsort((price, group_id))
+    g_sorted, p_sorted = group_id[order], price[order]
+    n_priced = np.bincount(group_id, weights=priced).astype(int)
+    start = np.concatenate(([0], np.cumsum(np.bincount(group_id))[:-1]))
+
+    # Competition rank: equal prices take the position of their first occurrence.
+    idx = np.arange(len(p_sorted))
+    new_value = np.ones(len(p_sorted), dtype=bool)
+    new_value[1:] = (g_sorted[1:] != g_sorted[:-1]) | (p_sorted[1:] != p_sorted[:-1])
+    rank_sorted = np.maximum.accumulate(np.where(new_value, idx, 0)) - start[g_sorted]
+    rank = np.empty_like(rank_sorted)
+    rank[order] = rank_sorted
+
+    frac = rank / np.maximum(n_priced[group_id] - 1, 1)
+    return np.where(priced, TIERS[np.digitize(frac, [1 / 3, 2 / 3], right=True)], UNPRICED_TIER)
+
+
+def route_stats(cards: list[dict], iqr_k: float = 1.5) -> tuple[list[dict], np.ndarray]:
+    """Returns (per-route stats, outlier flag per card in `cards` order).
+
+    Cards without two real IATA codes get no route and are never outliers.
+    """
+    fares = pipeline.load_stage("build_fares_index")
+    known = np.array([fares.known_code(c["origin"]) and fares.known_code(c["dest"]) for c in cards], dtype=bool)
+    if not known.all():
+        stats, outlier = route_stats([c for c, k in zip(cards, known) if k], iqr_k) if known.any() else ([], [])
+        flags = np.zeros(len(cards), dtype=bool)
+        flags[known] = outlier
+        return stats, flags
+
+    routes, route_id = np.unique(np.array([c["route"] for c in cards]), return_inverse=True)
+    price = _prices(cards)
+    priced = ~np.isnan(price)
+
+    # Sort by route, then price (NaN last), so each route's priced cards form one ascending run.
+    p_sorted = price[np.lexsort((price, route_id))]
+
+    n_routes = len(routes)
+    count = np.bincount(route_id, minlength=n_routes)
+    n_priced = np.bincount(route_id, weights=priced, minlength=n_routes).astype(int)
+    start = np.concatenate(([0], np.cumsum(count)[:-1]))
+
+    def quantile(q: float) -> np.ndarray:
+        # Linear interpolation inside each route's sorted run (numpy's default method), all routes at once.
+        pos = start + q * np.maximum(n_priced - 1, 0)
+        lo, hi = np.floor(pos).astype(int), np.ceil(pos).astype(int)
+        lo_v = p_sorted[np.minimum(lo, len(p_sorted) - 1)]
+        hi_v = p_sorted[np.minimum(hi, len(p_sorted) - 1)]
+        out = lo_v + (hi_v - lo_v) * (pos - lo)
+        return np.where(n_priced > 0, out, np.nan)
+
+    p_min, q1, median, q3, p_max = (quantile(q) for q in (0.0, 0.25, 0.5, 0.75, 1.0))
+    iqr = q3 - q1
+    low_fence, high_fence = q1 - iqr_k * iqr, q3 + iqr_k * iqr
+    with np.errstate(invalid="ignore"):
+        outlier = priced & ((price < low_fence[route_id]) | (price > high_fence[route_id]))
+
+    n_outliers = np.bincount(route_id, weights=outlier, minlength=n_routes).astype(int)
+    stats = []
+    for i, key in enumerate(routes):
+        row = {"route": str(key), "cards": int(count[i]), "priced": int(n_priced[i]), "outliers": int(n_outliers[i])}
+        for name, arr in (("min", p_min), ("q1", q1), ("median", median), ("q3", q3), ("max", p_max)):
+            row[name] = None if np.isnan(arr[i]) else round(float(arr[i]), 1)
+        stats.append(row)
+    return stats, outlier
+
+
+def apply_tiers(cards: list[dict], tier: np.ndarray, dry_run: bool = False) -> list[dict]:
+    """Rewrite data-fare-tier where it changed; every page is read and written at most once."""
+    public = pipeline.path("PUBLIC_DIR")
+    by_page: dict[str, list[tuple[dict, str]]] = {}
+    changes = []
+    for c, t in zip(cards, tier.tolist()):
+        if c["tier"] != t:
+            by_page.setdefault(c["page"], []).append((c, t))
+            changes.append({"page": c["page"], "route": c["route"], "n": c["n"], "price": c["price"], "from": c["tier"], "to": t})
+
+    if dry_run:
+        return changes
+
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    for page, edits in by_page.items():
+        fp = public / page / "index.html"
+        html = fp.read_text(encoding="utf-8")
+        parts, pos = [], 0
+        for c, t in sorted(edits, key=lambda e: e[0]["start"]):
+            tag_end = html.index(">", c["start"]) + 1
+            parts += [html[pos : c["start"]], _TIER_ATTR_RE.sub(f"data-fare-tier=\"{t}\"", html[c["start"] : tag_end], count=1)]
+            pos = tag_end
+        parts.append(html[pos:])
+        fp.write_text("".join(parts), encoding="utf-8")
+        sync.note_changed(page)
+    return changes
+
+
+def render_markdown(stats: list[dict], cards: list[dict], outlier: np.ndarray, changes: list[dict]) -> str:
+    def fmt(v: float | None) -> str:
+        return "-" if v is None else f"{v:g}"
+
+    lines = ["# Route fare statistics", ""]
+    lines.append(f"Routes: {len(stats)}. Cards: {len(cards)}. Outliers: {int(outlier.sum())}. Tier changes: {len(changes)}.")
+    lines += ["", "| Route | Cards | Priced | Min | Q1 | Median | Q3 | Max | Outliers |", "| --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |"]
+    for s in stats:
+        lines.append(
+            f"| {s['route']} | {s['cards']} | {s['priced']} | {fmt(s['min'])} | {fmt(s['q1'])} | {fmt(s['median'])} "
+            f"| {fmt(s['q3'])} | {fmt(s['max'])} | {s['outliers']} |"
+        )
+
+    flagged = [c for c, o in zip(cards, outlier.tolist()) if o]
+    if flagged:
+        lines += ["", "## Outliers", ""]
+        lines += [f"- {c['route']} GBP {c['price']} on {c['page']}" for c in flagged]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Route fare statistics and price-ranked tiers.")
+    ap.add_argument("--dry-run", action="store_true", help="Report tier changes without rewriting pages")
+    ap.add_argument("--iqr-k", type=float, default=1.5, help="Outlier fence multiplier")
+    ap.add_argument("--out", type=Path, default=pipeline.path("REPORT_DIR"), help="Directory for fare-stats.json/.md")
+    args = ap.parse_args(argv)
+
+    cards = load_cards()
+    if not cards:
+        print("OK", {"cards": 0})
+        return 0
+
+    stats, outlier = route_stats(cards, args.iqr_k)
+    _, page_id = np.unique(np.array([c["page"] for c in cards]), return_inverse=True)
+    tier = rank_tiers(page_id, _prices(cards))
+    changes = apply_tiers(cards, tier, args.dry_run)
+
+    if changes and not args.dry_run and pipeline.path("FARES_JSON").exists():
+        pipeline.load_stage("build_fares_index").main([])
+
+    report = {
+        "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S+00:00"),
+        "routes": stats,
+        "outliers": [
+            {k: c[k] for k in ("route", "page", "n", "price")} for c, o in zip(cards, outlier.tolist()) if o
+        ],
+        "tier_changes": changes,
+    }
+    args.out.mkdir(parents=True, exist_ok=True)
+    (args.out / "fare-stats.json").write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    (args.out / "fare-stats.md").write_text(render_markdown(stats, cards, outlier, changes), encoding="utf-8")
+
+    print(
+        "OK",
+        {
+            "routes": len(stats),
+            "cards": len(cards),
+            "outliers": int(outlier.sum()),
+            "tier_changes": len(changes),
+            "dry_run": args.dry_run,
+            "report": str(args.out),
+        },
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
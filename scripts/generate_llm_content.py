@@ -0,0 +1,238 @@
+"""Local-LLM content stage: long-form route guides from an Ollama-compatible server.
+
+Why:
+- VUKA copy is meant to come from a local LLM (see sync-from-sheet.yml), but
+  the fill step renders the same fixed guide for every keyword.
+
+What it does:
+- For every Primary row in public/landing-pages-keywords.csv, asks the model
+  (POST {OLLAMA_URL}/api/generate, streamed NDJSON) for a route guide
+- Runs requests concurrently with asyncio, bounded by --concurrency
+- Caches accepted completions on disk under .cache/llm/, keyed by a hash of
+  prompt + model + keyword, so reruns cost nothing. .cache/llm/index.json
+  points each keyword at its latest accepted guide; `vuka fill`, `watch` and
+  the sheet sync render that guide instead of the static one.
+- Rejects completions outside the word-count window and falls back to the
+  static renderer on timeout, HTTP error or invalid output (fallbacks are not
+  cached, so the next run retries them)
+- Writes the guide into the page's AUTO_SEO block via the fill renderer and
+  prints throughput and cache hit rate
+
+scripts/tests/test_generate_llm_content.py runs it against an in-process fake
+NDJSON server.
+
+Run:
+  python scripts/vuka.py generate
+  OLLAMA_URL=http://127.0.0.1:11434 VUKA_LLM_MODEL=llama3.1:8b python scripts/generate_llm_content.py --concurrency 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import pipeline
+
+OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://127.0.0.1:11434")
+MODEL = os.environ.get("VUKA_LLM_MODEL", "llama3.1:8b")
+LLM_CACHE_DIR = pipeline.REPO_ROOT / ".cache" / "llm"
+
+MIN_WORDS = 900
+MAX_WORDS = 2600
+
+PROMPT_TEMPLATE = """You write long-form travel guides for VUKA Travels, a UK flight agency.
+Write a practical booking guide for travellers searching for "{keyword}"{location}.
+
+Rules:
+- Between {min_words} and {max_words} words.
+- Use "## " for section headings and "- " for bullet points. No other Markdown.
+- Cover: flexibility and dates, direct vs one-stop routing, baggage rules, best time to book,
+  airports, families and groups, and what to send VUKA for a live quote.
+- Plain British English. Do not invent exact prices, airline schedules or guarantees.
+"""
+
+
+def build_prompt(keyword: str, location: str) -> str:
+    return PROMPT_TEMPLATE.format(
+        keyword=keyword.strip().lower(),
+        location=f" (destination: {location})" if location else "",
+        min_words=MIN_WORDS,
+        max_words=MAX_WORDS,
+    )
+
+
+def cache_key(prompt: str, model: str, keyword: str) -> str:
+    return hashlib.sha256(json.dumps([prompt, model, keyword.strip().lower()]).encode("utf-8")).hexdigest()
+
+
+def _word_count(text: str) -> int:
+    return len([w for w in re.split(r"\s+", text.strip()) if w])
+
+
+async def _body_chunks(reader: asyncio.StreamReader, chunked: bool):
+    if not chunked:
+        while data := await reader.read(65536):
+            yield data
+        return
+    while True:
+        size = int((await reader.readline()).split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            return
+        yield await reader.readexactly(size)
+        await reader.readexactly(2)
+
+
+async def stream_generate(url: str, payload: dict):
+    """POST JSON and yield each NDJSON object as it arrives (HTTP/1.1, stdlib only)."""
+    u = urlsplit(url)
+    port = u.port or (443 if u.scheme == "https" else 80)
+    reader, writer = await asyncio.open_connection(u.hostname, port, ssl=u.scheme == "https" or None)
+    try:
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"POST {u.path or '/'} HTTP/1.1\r\n"
+            f"Host: {u.netloc}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = (await reader.readline()).split()
+        if len(status_line) < 2 or not status_line[1].isdigit():
+            raise RuntimeError(f"No HTTP status line from {url}")
+        status = int(status_line[1])
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            k, _, v = line.decode("latin-1").partition(":")
+            headers[k.strip().lower()] = v.strip()
+        if status != 200:
+            raise RuntimeError(f"HTTP {status} from {url}")
+
+        buf = b""
+        async for data in _body_chunks(reader, headers.get("transfer-encoding", "").lower() == "chunked"):
+            buf += data
+            while b"\n" in buf:
+                line, buf = buf.split(b"\n", 1)
+                if line.strip():
+                    yield json.loads(line)
+        if buf.strip():
+            yield json.loads(buf)
+    finally:
+        writer.close()
+
+
+async def complete(prompt: str, model: str, base_url: str) -> str:
+    parts: list[str] = []
+    async for msg in stream_generate(base_url.rstrip("/") + "/api/generate", {"model": model, "prompt": prompt, "stream": True}):
+        if msg.get("error"):
+            raise RuntimeError(msg["error"])
+        parts.append(msg.get("response", ""))
+        if msg.get("done"):
+            break
+    return "".join(parts)
+
+
+async def generate_one(row: tuple[str, str, str], sem: asyncio.Semaphore, opts: argparse.Namespace, stats: dict) -> tuple[str, str | None]:
+    """Returns (url, guide html) or (url, None) when the static renderer should be used."""
+    url, kw, loc = row
+    prompt = build_prompt(kw, loc)
+    fill = pipeline.load_stage("fill_landing_pages")
+    key = cache_key(prompt, opts.model, kw)
+    fp = opts.cache_dir / f"{key}.json"
+
+    if fp.exists():
+        stats["cache_hits"] += 1
+        stats["index"][kw.strip().lower()] = key
+        return url, fill.text_to_html(kw, json.loads(fp.read_text(encoding="utf-8"))["text"])
+
+    async with sem:
+        try:
+            text = await asyncio.wait_for(complete(prompt, opts.model, opts.url), timeout=opts.timeout)
+        # EOFError covers asyncio.IncompleteReadError (server hung up mid-body).
+        except (asyncio.TimeoutError, OSError, EOFError, RuntimeError, ValueError) as e:
+            print("FALLBACK", {"keyword": kw, "reason": repr(e)[:160]})
+            stats["fallbacks"] += 1
+            return url, None
+
+    words = _word_count(text)
+    if not opts.min_words <= words <= opts.max_words:
+        print("FALLBACK", {"keyword": kw, "reason": f"{words} words outside {opts.min_words}-{opts.max_words}"})
+        stats["fallbacks"] += 1
+        return url, None
+
+    fp.parent.mkdir(parents=True, exist_ok=True)
+    fp.write_text(json.dumps({"keyword": kw, "model": opts.model, "words": words, "text": text}, ensure_ascii=False), encoding="utf-8")
+    stats["generated"] += 1
+    stats["index"][kw.strip().lower()] = key
+    return url, fill.text_to_html(kw, text)
+
+
+def update_index(cache_dir: Path, entries: dict[str, str]) -> None:
+    # keyword -> cache key of its latest accepted guide, read by fill_landing_pages.cached_guide().
+    if not entries:
+        return
+    fp = cache_dir / "index.json"
+    index = json.loads(fp.read_text(encoding="utf-8")) if fp.exists() else {}
+    index.update(entries)
+    fp.parent.mkdir(parents=True, exist_ok=True)
+    fp.write_text(json.dumps(dict(sorted(index.items())), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+async def run(rows: list[tuple[str, str, str]], opts: argparse.Namespace) -> dict:
+    fill = pipeline.load_stage("fill_landing_pages")
+    stats = {"rows": len(rows), "cache_hits": 0, "generated": 0, "fallbacks": 0, "updated": 0, "index": {}}
+    sem = asyncio.Semaphore(opts.concurrency)
+    started = time.perf_counter()
+
+    by_url = {url: (kw, loc) for url, kw, loc in rows}
+    for fut in asyncio.as_completed([generate_one(r, sem, opts, stats) for r in rows]):
+        url, long_html = await fut
+        # long_html=None renders what `vuka fill` would: an earlier accepted guide, the page's own
+        # generated guide, else the static one.
+        if fill.fill_page(url, *by_url[url], long_html=long_html):
+            stats["updated"] += 1
+    update_index(opts.cache_dir, stats.pop("index"))
+
+    elapsed = time.perf_counter() - started
+    stats["seconds"] = round(elapsed, 3)
+    stats["pages_per_sec"] = round(len(rows) / elapsed, 2) if elapsed else None
+    stats["cache_hit_rate"] = round(stats["cache_hits"] / len(rows), 3) if rows else None
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Generate route guides with a local Ollama-compatible LLM.")
+    ap.add_argument("--url", default=OLLAMA_URL, help="Server base URL (default: $OLLAMA_URL)")
+    ap.add_argument("--model", default=MODEL, help="Model name (default: $VUKA_LLM_MODEL)")
+    ap.add_argument("--concurrency", type=int, default=4, help="Max in-flight requests")
+    ap.add_argument("--timeout", type=float, default=180.0, help="Seconds per completion before falling back")
+    ap.add_argument("--min-words", type=int, default=MIN_WORDS)
+    ap.add_argument("--max-words", type=int, default=MAX_WORDS)
+    ap.add_argument("--cache-dir", type=Path, default=LLM_CACHE_DIR)
+    ap.add_argument("--only", action="append", default=[], help="Limit to these page slugs (repeatable)")
+    args = ap.parse_args(argv)
+
+    fill = pipeline.load_stage("fill_landing_pages")
+    if not fill.KEYWORDS_CSV.exists():
+        print(f"Missing {fill.KEYWORDS_CSV}")
+        return 2
+
+    rows = [r for r in fill.read_primary_rows() if fill.url_to_public_path(r[0]).exists()]
+    if args.only:
+        rows = [r for r in rows if fill.url_to_public_path(r[0]).parent.name in set(args.only)]
+
+    print("OK", asyncio.run(run(rows, args)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,6 +12,9 @@ What it does:
 - Adds:
     data-origin, data-dest, data-currency, data-route-key, data-fare-tier, data-price-gbp
   and adds data-price on the <strong> element (for easy JS targeting later).
+- data-fare-tier comes from the card's price rank on its page, ranked the
+  same way as rank_tiers() in `vuka tiers` (scripts/fare_stats.py), but in
+  plain Python: one page's cards don't need numpy.
 
 It does NOT change visible copy (other than adding data-price attr).
 
@@ -22,10 +25,13 @@ Run:
 from __future__ import annotations
 
 import re
+from bisect import bisect_left
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 PUBLIC_DIR = REPO_ROOT / "public"
+# Changed page slugs for scripts/submit_indexnow.py (shared with the sync/fill stages).
+CHANGED_LEDGER = REPO_ROOT / ".cache" / "changed-pages.txt"
 
 
 def _extract_iata(article_html: str) -> tuple[str | None, str | None]:
@@ -52,6 +58,21 @@ def _extract_price_gbp(article_html: str) -> int | None:
         return None
 
 
+def _page_tiers(prices: list[int | None]) -> list[str]:
+    # fare_stats.rank_tiers for a single page: competition rank among the priced
+    # cards, cheapest third "low", middle "mid", dearest third "high".
+    ranked = sorted(p for p in prices if p is not None)
+    top = max(len(ranked) - 1, 1)
+    tiers = []
+    for p in prices:
+        if p is None:
+            tiers.append("other")
+            continue
+        frac = bisect_left(ranked, p) / top
+        tiers.append("low" if frac <= 1 / 3 else "mid" if frac <= 2 / 3 else "high")
+    return tiers
+
+
 def _ensure_data_price_on_strong(article_html: str) -> str:
     def repl(m: re.Match) -> str:
         attrs = m.group(1) or ""
@@ -71,11 +92,16 @@ def migrate_file(fp: Path) -> bool:
     if "class=\"fare-item\"" not in html:
         return False
 
-    tiers = ["low", "mid", "high", "other"]
+    # Tier from the price rank among all of the page's cards, already migrated ones included.
+    articles = re.findall(r"<article class=\"fare-item\"[\s\S]*?</article>", html)
+    page_tiers = _page_tiers([_extract_price_gbp(a) for a in articles])
+    positions: list[int] = []
+    pos = -1
 
     def replace_article(match: re.Match) -> str:
-        nonlocal changed
+        nonlocal changed, pos
         article = match.group(0)
+        pos += 1
 
         # Skip if already migrated.
         if "data-origin=" in article and "data-dest=" in article:
@@ -90,11 +116,11 @@ def migrate_file(fp: Path) -> bool:
 
         route_key = f"{origin}-{dest}"
 
-        # Choose a tier based on order on the page (we'll count articles in the file).
-        # We'll fill this after we know which number this article is.
+        # We'll fill the tier in after we know which card on the page this is.
+        positions.append(pos)
         return "__FARE_ARTICLE_PLACEHOLDER__" + article + "__END_FAKE__"  # temp
 
-    # First, mark candidates (so we can tier by occurrence).
+    # First, mark candidates (remembering each one's position among the page's cards).
     marked = re.sub(r"<article class=\"fare-item\"[\s\S]*?</article>", replace_article, html)
     if marked == html:
         return False
@@ -113,7 +139,7 @@ def migrate_file(fp: Path) -> bool:
         price = _extract_price_gbp(article)
 
         if origin and dest:
-            tier = tiers[occ] if occ < 3 else tiers[-1]
+            tier = page_tiers[positions[occ]]
             attrs = [
                 f"data-origin=\"{origin}\"",
                 f"data-dest=\"{dest}\"",
@@ -148,6 +174,9 @@ def migrate_file(fp: Path) -> bool:
 
     if changed and html2 != html:
         fp.write_text(html2, encoding="utf-8")
+        CHANGED_LEDGER.parent.mkdir(parents=True, exist_ok=True)
+        with CHANGED_LEDGER.open("a", encoding="utf-8") as f:
+            f.write(fp.parent.name + "\n")
         return True
     return False
 
@@ -0,0 +1,109 @@
+"""Shared paths and stage loading for the landing-page pipeline.
+
+The stage scripts under .github/scripts/ and scripts/ each keep their own
+module-level path constants so they still run standalone from CI. The `vuka`
+CLI (scripts/vuka.py) and the newer stages import this module instead: paths
+are resolved once from the repo root and pushed into every stage it loads.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+STAGE_DIRS = [REPO_ROOT / ".github" / "scripts", REPO_ROOT / "scripts"]
+
+# Stages import their shared helpers (.github/scripts/stage_loader.py) by plain module name.
+for _d in STAGE_DIRS:
+    if str(_d) not in sys.path:
+        sys.path.append(str(_d))
+
+# Module-level constants a stage may define; configure() overwrites whichever exist.
+_PATH_ATTRS = {
+    "REPO_ROOT": lambda root: root,
+    "PUBLIC_DIR": lambda root: root / "public",
+    "DIST_DIR": lambda root: root / "dist",
+    "KEYWORDS_CSV": lambda root: root / "public" / "landing-pages-keywords.csv",
+    "SITEMAP_XML": lambda root: root / "public" / "sitemap.xml",
+    "MANIFEST_JSON": lambda root: root / "public" / "landing-pages-manifest.json",
+    "FARES_JSON": lambda root: root / "public" / "fares.json",
+    "ROUTE_INDEX_JSON": lambda root: root / "public" / "route-index.json",
+    "HTACCESS": lambda root: root / "public" / ".htaccess",
+    "NGINX_REDIRECT_MAP": lambda root: root / "deploy" / "nginx-redirects.map",
+    "BUDGETS_JSON": lambda root: root / "scripts" / "page-budgets.json",
+    "BASELINE_JSON": lambda root: root / "scripts" / "page-weight-baseline.json",
+    "REPORT_DIR": lambda root: root / "reports",
+    "SHARD_DIR": lambda root: root / ".cache" / "shards",
+    "CHANGED_LEDGER": lambda root: root / ".cache" / "changed-pages.txt",
+    "LLM_CACHE_DIR": lambda root: root / ".cache" / "llm",
+}
+
+_root = REPO_ROOT
+
+
+def set_root(root: Path) -> None:
+    """Point every stage (already loaded or loaded later) at another checkout."""
+    global _root
+    _root = root.resolve()
+    for mod in list(sys.modules.values()):
+        if getattr(mod, "__vuka_stage__", False):
+            configure(mod)
+
+
+def root() -> Path:
+    return _root
+
+
+def path(name: str) -> Path:
+    return _PATH_ATTRS[name](_root)
+
+
+def configure(mod: ModuleType) -> ModuleType:
+    for name, resolve in _PATH_ATTRS.items():
+        if hasattr(mod, name):
+            setattr(mod, name, resolve(_root))
+    return mod
+
+
+def load_stage(name: str) -> ModuleType:
+    """Import a stage script by file name (without .py), configured with the shared paths."""
+    if name in sys.modules and getattr(sys.modules[name], "__vuka_stage__", False):
+        return sys.modules[name]
+
+    fp = stage_path(name)
+    spec = importlib.util.spec_from_file_location(name, fp)
+    mod = importlib.util.module_from_spec(spec)
+    mod.__vuka_stage__ = True
+    sys.modules[name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return configure(mod)
+
+
+def reload_stage(name: str) -> ModuleType:
+    """Re-import a stage from disk (used by watch mode when the renderer itself is edited).
+
+    If the new source fails to import, the previous module stays loaded and the error is re-raised.
+    """
+    old = sys.modules.pop(name, None)
+    try:
+        return load_stage(name)
+    except BaseException:
+        if old is not None:
+            sys.modules[name] = old
+        raise
+
+
+def stage_path(name: str) -> Path:
+    for d in STAGE_DIRS:
+        fp = d / f"{name}.py"
+        if fp.exists():
+            return fp
+    raise FileNotFoundError(f"Stage script not found: {name}.py")
@@ -0,0 +1,178 @@
+"""Plan landing pages from the route matrix instead of hand-typed sheet rows.
+
+Why:
+- Every new page starts as a row someone typed into the master sheet, while
+  the real catalogue is simply UK origins x destinations x phrase patterns.
+
+What it does:
+- Streams itertools.product(origins, destinations, patterns) lazily: one
+  candidate keyword at a time, never the whole matrix in memory
+- Slugs each keyword with the sheet sync's slugify() and drops it in O(1)
+  when the slug is already planned in this run, listed in
+  public/landing-pages-keywords.csv, or already a page under public/
+- Records each row's template (cheap / uk / alias) in its notes: from the
+  phrase pattern it came from, or for catalogue patterns without one from the
+  sync's classify_template(). The sync never has to guess which planned rows
+  are redirect aliases.
+- Plans an alias row only when its cheap-flights page exists or is planned
+  earlier in the same run, since the sync will not build it otherwise
+- Writes rows in batches, in master-sheet column order: to a CSV snapshot
+  (default reports/route-matrix.csv) or, with --sheet, appended to the master
+  sheet with status "planned" so nothing is built until a row is approved
+
+Run:
+  python scripts/vuka.py plan --limit 50
+  python scripts/vuka.py plan --catalogue routes.json --out planned.csv
+  python scripts/vuka.py plan --sheet                  # needs SHEETS_SA_JSON
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Iterator
+
+import pipeline
+
+ORIGINS = [
+    "London", "Manchester", "Birmingham", "Leeds", "Glasgow", "Edinburgh", "Bristol",
+    "Newcastle", "Liverpool", "Leicester", "Bradford", "Luton", "Cardiff", "Belfast",
+]
+DESTINATIONS = [
+    "Accra", "Lagos", "Abuja", "Nairobi", "Mombasa", "Entebbe", "Kigali", "Harare",
+    "Lusaka", "Dar es Salaam", "Banjul", "Dakar", "Addis Ababa", "Karachi", "Lahore",
+    "Islamabad", "Colombo", "Dubai",
+]
+# {origin} and {dest} are filled in lower case. Patterns without {origin} yield one row per destination.
+# Each pattern's template goes into the row notes, where it overrides the sync's phrase-based guess.
+PATTERN_TEMPLATES = {
+    "cheap flights from {origin} to {dest}": "cheap",
+    "flights to {dest} from uk": "uk",
+    "flights from {origin} to {dest}": "alias",
+}
+PATTERNS = list(PATTERN_TEMPLATES)
+
+SHEET_COLUMNS = ["site", "primary_keyword", "slug", "status", "content_type", "target_url", "notes"]
+PLANNED_STATUS = "planned"
+BATCH_SIZE = 500
+
+
+def load_catalogue(fp: Path | None) -> tuple[list[str], list[str], list[str]]:
+    if not fp:
+        return ORIGINS, DESTINATIONS, PATTERNS
+    data = json.loads(fp.read_text(encoding="utf-8"))
+    return data.get("origins", ORIGINS), data.get("destinations", DESTINATIONS), data.get("patterns", PATTERNS)
+
+
+def known_slugs() -> set[str]:
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    slugs = {d.name for d in pipeline.path("PUBLIC_DIR").iterdir() if d.is_dir()}
+    csv_fp = pipeline.path("KEYWORDS_CSV")
+    if csv_fp.exists():
+        with csv_fp.open("r", encoding="utf-8") as f:
+            slugs.update(sync.url_to_slug(r.get("Landing URL") or "") for r in csv.DictReader(f))
+    return slugs
+
+
+def candidates(origins: list[str], destinations: list[str], patterns: list[str], seen: set[str], stats: Counter) -> Iterator[dict]:
+    """Yield one planned row per new slug; `seen` is updated as rows are produced."""
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    base = sync.SITE_BASE.rstrip("/")
+    for origin, dest, pattern in itertools.product(origins, destinations, patterns):
+        stats["considered"] += 1
+        keyword = pattern.format(origin=origin.lower(), dest=dest.lower())
+        slug = sync.slugify(keyword)
+        if slug in seen:
+            stats["duplicate"] += 1
+            continue
+
+        template = PATTERN_TEMPLATES.get(pattern) or sync.classify_template(keyword, {})
+        if template == "alias" and sync.alias_canonical_slug(slug) not in seen:
+            stats["alias_without_canonical"] += 1
+            continue
+        seen.add(slug)
+        stats[template] += 1
+        yield {
+            "site": sync.SITE_KEY,
+            "primary_keyword": keyword,
+            "slug": slug,
+            "status": PLANNED_STATUS,
+            "content_type": "landing",
+            "target_url": f"{base}/{slug}/",
+            "notes": f"location={dest}; template={template}",
+        }
+
+
+def batched(rows: Iterator[dict], size: int) -> Iterator[list[dict]]:
+    while batch := list(itertools.islice(rows, size)):
+        yield batch
+
+
+def write_csv(rows: Iterator[dict], fp: Path, batch_size: int) -> int:
+    fp.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with fp.open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(SHEET_COLUMNS)
+        for batch in batched(rows, batch_size):
+            w.writerows([r[c] for c in SHEET_COLUMNS] for r in batch)
+            written += len(batch)
+    return written
+
+
+def sheet_slugs(ws) -> set[str]:
+    # Rows already in the sheet (planned or not) must not be appended twice.
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    idx, rows = sync.read_master_rows(ws)
+    return {sync.row_slug(row, idx) for _, row in rows}
+
+
+def write_sheet(ws, rows: Iterator[dict], batch_size: int) -> int:
+    header = ws.row_values(1)
+    written = 0
+    for batch in batched(rows, batch_size):
+        # One append_rows call per batch; columns follow the sheet's own header order.
+        ws.append_rows([[r.get(col, "") for col in header] for r in batch], value_input_option="RAW")
+        written += len(batch)
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Plan landing pages from origins x destinations x phrase patterns.")
+    ap.add_argument("--catalogue", type=Path, help='JSON with "origins", "destinations" and/or "patterns"')
+    ap.add_argument("--out", type=Path, default=pipeline.path("REPORT_DIR") / "route-matrix.csv", help="CSV snapshot path")
+    ap.add_argument("--sheet", action="store_true", help="Append the rows to the master sheet instead of a CSV")
+    ap.add_argument("--limit", type=int, help="Stop after this many new rows")
+    ap.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = ap.parse_args(argv)
+
+    origins, destinations, patterns = load_catalogue(args.catalogue)
+    stats: Counter = Counter()
+    seen = known_slugs()
+    ws = None
+    if args.sheet:
+        ws = pipeline.load_stage("sync_from_sheet_vuka").open_master_sheet()
+        seen |= sheet_slugs(ws)
+    stats["existing"] = len(seen)
+
+    rows = candidates(origins, destinations, patterns, seen, stats)
+    if args.limit is not None:
+        rows = itertools.islice(rows, args.limit)
+
+    if args.sheet:
+        written = write_sheet(ws, rows, args.batch_size)
+        target = "master sheet"
+    else:
+        written = write_csv(rows, args.out, args.batch_size)
+        target = str(args.out)
+
+    print("OK", {"written": written, "to": target, **dict(stats)})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
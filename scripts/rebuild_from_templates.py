@@ -0,0 +1,207 @@
+"""Targeted rebuild of landing pages after a template edit.
+
+Why:
+- clone_template() copies a template page once. Without a record of where a
+  page came from, a template fix meant hand-editing every page.
+
+What it does:
+- public/landing-pages-manifest.json records, per page, the source template
+  and the digest of the template "chrome" (the <head> minus page meta tags,
+  and the footer + scripts) it was built from. The sheet sync writes an entry
+  whenever it clones a template.
+- A rebuild compares each template's current digest with the manifest and
+  regenerates only the stale dependants: template chrome + the page's own
+  meta tags and body (header, hero, fare cards with their data-* attributes,
+  and the AUTO_SEO block).
+- Scope is the chrome only. Every page's body carries its own route copy and
+  fare cards, so edits inside the template's body are not rolled out.
+- --init adopts an untracked page only when its chrome already matches the
+  template's; hand-built pages with their own chrome stay untracked.
+- Stale pages are rebuilt in parallel worker processes.
+
+Run:
+  python scripts/vuka.py rebuild --init     # adopt existing pages (one-off)
+  python scripts/vuka.py rebuild --dry-run
+  python scripts/vuka.py rebuild [--template flights-to-accra-from-uk] [--jobs 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pipeline
+
+# Below this many stale pages a process pool costs more than it saves.
+PARALLEL_MIN_PAGES = 8
+
+_worker: dict = {"templates": {}, "public": None}
+
+
+def render_from_template(template_html: str, page_html: str) -> str:
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    t_head, _, t_tail = sync.split_template_regions(template_html)
+    p_head, p_body, _ = sync.split_template_regions(page_html)
+
+    head = t_head
+    for pattern in sync.PAGE_HEAD_TAGS:
+        page_tag = re.search(pattern, p_head, flags=re.DOTALL)
+        tpl_tag = re.search(pattern, head, flags=re.DOTALL)
+        if tpl_tag and page_tag:
+            head = head[: tpl_tag.start()] + page_tag.group(0) + head[tpl_tag.end() :]
+        elif tpl_tag:
+            # Never leak the template's own canonical/title into a dependant (its line goes too).
+            line = re.search(r"\n[ \t]*" + pattern, head, flags=re.DOTALL)
+            start = line.start() if line and line.end() == tpl_tag.end() else tpl_tag.start()
+            head = head[:start] + head[tpl_tag.end() :]
+        elif page_tag:
+            body_end = len(head.rstrip())
+            head = head[:body_end] + "\n  " + page_tag.group(0) + head[body_end:]
+    return head + p_body + t_tail
+
+
+def infer_template(slug: str) -> str:
+    # Same split main() uses when it clones: "flights to X from uk" pages come from the UK template.
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    if re.match(r"^flights-to-.+-from-uk(?:-\d+)?$", slug):
+        return sync.TEMPLATE_PRIMARY_UK
+    return sync.TEMPLATE_PRIMARY_CHEAP
+
+
+def _is_landing_page(html: str) -> bool:
+    return "<main class=\"page\"" in html and re.search(r"\n\s*<footer\b", html) is not None
+
+
+def adopt_existing(manifest: dict) -> int:
+    """Record untracked landing pages whose chrome matches their inferred template's, as up to date."""
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    public = pipeline.path("PUBLIC_DIR")
+    templates = {sync.TEMPLATE_PRIMARY_CHEAP, sync.TEMPLATE_PRIMARY_UK}
+    template_html = {slug: (public / slug / "index.html").read_text(encoding="utf-8") for slug in templates}
+    template_digests = {slug: sync.template_digest(html) for slug, html in template_html.items()}
+
+    added = 0
+    for d in sorted(public.iterdir()):
+        fp = d / "index.html"
+        if not d.is_dir() or d.name in templates or d.name in manifest["pages"] or not fp.exists():
+            continue
+        html = fp.read_text(encoding="utf-8")
+        if not _is_landing_page(html):
+            continue
+        tpl = infer_template(d.name)
+        # A page with its own chrome was not cloned from the template; a rebuild would overwrite it.
+        if sync.template_digest(html) != template_digests[tpl]:
+            continue
+        sync.record_template(manifest, d.name, tpl, template_html[tpl])
+        added += 1
+    return added
+
+
+def stale_pages(manifest: dict, only_template: str | None = None) -> dict[str, list[str]]:
+    """template slug -> dependants whose recorded digest differs from the template's current one."""
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    public = pipeline.path("PUBLIC_DIR")
+    digests: dict[str, str | None] = {}
+    out: dict[str, list[str]] = {}
+    for slug, entry in manifest["pages"].items():
+        tpl = entry.get("template")
+        if not tpl or (only_template and tpl != only_template):
+            continue
+        if tpl not in digests:
+            fp = public / tpl / "index.html"
+            digests[tpl] = sync.template_digest(fp.read_text(encoding="utf-8")) if fp.exists() else None
+        if digests[tpl] and entry.get("template_digest") != digests[tpl]:
+            out.setdefault(tpl, []).append(slug)
+    return out
+
+
+def _init_worker(templates: dict[str, str], public: Path) -> None:
+    # Passed explicitly so spawned workers honour `vuka --root` too.
+    _worker["templates"] = templates
+    _worker["public"] = public
+
+
+def _rebuild_one(task: tuple[str, str]) -> tuple[str, bool]:
+    slug, tpl = task
+    fp = _worker["public"] / slug / "index.html"
+    if not fp.exists():
+        return slug, False
+    html = fp.read_text(encoding="utf-8")
+    html2 = render_from_template(_worker["templates"][tpl], html)
+    if html2 != html:
+        fp.write_text(html2, encoding="utf-8")
+        return slug, True
+    return slug, False
+
+
+def rebuild(only_template: str | None = None, jobs: int | None = None) -> dict:
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    public = pipeline.path("PUBLIC_DIR")
+    manifest = sync.load_manifest()
+    stale = stale_pages(manifest, only_template)
+
+    templates = {tpl: (public / tpl / "index.html").read_text(encoding="utf-8") for tpl in stale}
+    tasks = [(slug, tpl) for tpl, slugs in stale.items() for slug in slugs]
+
+    if len(tasks) < PARALLEL_MIN_PAGES or jobs == 1:
+        _init_worker(templates, public)
+        results = [_rebuild_one(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=jobs or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(templates, public),
+        ) as pool:
+            results = list(pool.map(_rebuild_one, tasks, chunksize=max(1, len(tasks) // 32)))
+
+    for slug, tpl in tasks:
+        sync.record_template(manifest, slug, tpl, templates[tpl])
+    for slug, wrote in results:
+        if wrote:
+            sync.note_changed(slug)
+    if tasks:
+        sync.save_manifest(manifest)
+
+    return {
+        "stale": len(tasks),
+        "rewritten": sum(1 for _, wrote in results if wrote),
+        "changed_pages": [slug for slug, wrote in results if wrote],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Rebuild pages whose source template changed.")
+    ap.add_argument("--template", help="Only roll out this template slug")
+    ap.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    ap.add_argument("--init", action="store_true", help="Record untracked pages against their inferred template")
+    ap.add_argument("--dry-run", action="store_true", help="List stale pages without rewriting them")
+    args = ap.parse_args(argv)
+
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+
+    if args.init:
+        manifest = sync.load_manifest()
+        added = adopt_existing(manifest)
+        sync.save_manifest(manifest)
+        print("OK", {"adopted": added, "tracked": len(manifest["pages"])})
+        return 0
+
+    if args.dry_run:
+        stale = stale_pages(sync.load_manifest(), args.template)
+        for tpl, slugs in stale.items():
+            print(tpl)
+            for slug in slugs:
+                print(f"  {slug}")
+        print("OK", {"stale": sum(len(v) for v in stale.values())})
+        return 0
+
+    result = rebuild(args.template, args.jobs)
+    print("OK", {k: v for k, v in result.items() if k != "changed_pages"})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,189 @@
+"""Submit changed landing-page URLs through IndexNow.
+
+Why:
+- The workflows pinged the Google/Bing sitemap endpoints on every push. Google
+  has retired its endpoint, and a ping only makes crawlers re-read the whole
+  sitemap. IndexNow takes the exact URLs that changed.
+
+What it does:
+- Reads the changed-page ledger (.cache/changed-pages.txt) that sync, fill,
+  migrate and rebuild append to whenever a page's bytes change, or, with
+  --git-diff REV, the landing pages changed since REV (for push-triggered CI
+  where the ledger is not available)
+- POSTs the URLs in batches to the IndexNow endpoint, retrying 429/5xx and
+  network errors with exponential backoff
+- Writes the key file public/<key>.txt (it must be deployed before
+  submitting) and clears the ledger after a successful run; in CI, where a
+  file written now would never be deployed, a missing key file is an error
+- Does nothing when no page changed
+
+Run:
+  python scripts/vuka.py indexnow --init-key        # one-off: create a key + key file
+  INDEXNOW_KEY=... python scripts/vuka.py indexnow [--dry-run]
+  INDEXNOW_KEY=... python scripts/submit_indexnow.py --git-diff HEAD~1
+  INDEXNOW_ENDPOINT=http://127.0.0.1:8765/indexnow python scripts/submit_indexnow.py   # local stand-in
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import secrets
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import urlsplit
+
+import pipeline
+
+ENDPOINT = os.environ.get("INDEXNOW_ENDPOINT", "https://api.indexnow.org/indexnow")
+KEY = os.environ.get("INDEXNOW_KEY", "")
+
+# Protocol limit is 10,000 URLs per POST.
+BATCH_SIZE = 10_000
+RETRIES = 4
+BACKOFF = 2.0
+
+# 200 OK and 202 Accepted (key validation pending) both mean the batch was taken.
+ACCEPTED = {200, 202}
+RETRYABLE = {429, 500, 502, 503, 504}
+
+
+def key_file_ok(key: str) -> bool:
+    """True when public/<key>.txt exists and holds the key."""
+    if not re.fullmatch(r"[A-Za-z0-9-]{8,128}", key):
+        raise SystemExit("INDEXNOW_KEY must be 8-128 characters of a-z, A-Z, 0-9 or '-'")
+    fp = pipeline.path("PUBLIC_DIR") / f"{key}.txt"
+    return fp.exists() and fp.read_text(encoding="utf-8").strip() == key
+
+
+def ensure_key_file(key: str) -> bool:
+    """Write public/<key>.txt; returns True when it had to be created or fixed."""
+    if key_file_ok(key):
+        return False
+    (pipeline.path("PUBLIC_DIR") / f"{key}.txt").write_text(key + "\n", encoding="utf-8")
+    return True
+
+
+def read_ledger() -> list[str]:
+    fp = pipeline.path("CHANGED_LEDGER")
+    if not fp.exists():
+        return []
+    return list(dict.fromkeys(line.strip() for line in fp.read_text(encoding="utf-8").splitlines() if line.strip()))
+
+
+def git_changed_slugs(rev: str) -> list[str]:
+    out = subprocess.run(
+        ["git", "diff", "--name-only", rev, "--", "public/*/index.html"],
+        cwd=pipeline.root(),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return [line.split("/")[1] for line in out.splitlines() if line.count("/") == 2]
+
+
+def changed_urls(slugs: list[str], base: str) -> list[str]:
+    # Only live landing pages: deleted pages and redirect stubs (noindex) are left to the crawler.
+    public = pipeline.path("PUBLIC_DIR")
+    urls = []
+    for slug in slugs:
+        fp = public / slug / "index.html"
+        if fp.exists() and 'http-equiv="refresh"' not in fp.read_text(encoding="utf-8"):
+            urls.append(f"{base.rstrip('/')}/{slug}/")
+    return urls
+
+
+def post_batch(endpoint: str, payload: dict, retries: int = RETRIES, backoff: float = BACKOFF) -> int:
+    body = json.dumps(payload).encode("utf-8")
+    for attempt in range(retries + 1):
+        req = urllib.request.Request(endpoint, data=body, headers={"Content-Type": "application/json; charset=utf-8"})
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                status = resp.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        except (urllib.error.URLError, TimeoutError) as e:
+            status = None
+            print("RETRY", {"attempt": attempt + 1, "error": repr(e)[:160]})
+
+        if status in ACCEPTED:
+            return status
+        if status is not None and status not in RETRYABLE:
+            # 400/403/422: bad request, key mismatch or foreign host; retrying will not help.
+            return status
+        if attempt < retries:
+            time.sleep(backoff * 2**attempt)
+    return status or 0
+
+
+def submit(urls: list[str], key: str, base: str, endpoint: str = ENDPOINT, batch_size: int = BATCH_SIZE) -> dict:
+    host = urlsplit(base).hostname
+    stats = {"urls": len(urls), "batches": 0, "failed_batches": 0, "statuses": []}
+    for i in range(0, len(urls), batch_size):
+        payload = {
+            "host": host,
+            "key": key,
+            "keyLocation": f"{base.rstrip('/')}/{key}.txt",
+            "urlList": urls[i : i + batch_size],
+        }
+        status = post_batch(endpoint, payload)
+        stats["batches"] += 1
+        stats["statuses"].append(status)
+        if status not in ACCEPTED:
+            stats["failed_batches"] += 1
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Submit changed landing pages via IndexNow.")
+    ap.add_argument("--git-diff", metavar="REV", help="Use pages changed since REV instead of the ledger")
+    ap.add_argument("--endpoint", default=ENDPOINT, help="IndexNow endpoint (default: $INDEXNOW_ENDPOINT)")
+    ap.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    ap.add_argument("--init-key", action="store_true", help="Generate a key and its public/<key>.txt file")
+    ap.add_argument("--dry-run", action="store_true", help="Print the URLs without submitting")
+    args = ap.parse_args(argv)
+
+    if args.init_key:
+        key = secrets.token_hex(16)
+        ensure_key_file(key)
+        print("OK", {"key": key, "key_file": str(pipeline.path("PUBLIC_DIR") / f"{key}.txt")})
+        print("Store the key as the INDEXNOW_KEY secret and deploy the key file before submitting.")
+        return 0
+
+    base = pipeline.load_stage("sync_from_sheet_vuka").SITE_BASE
+    slugs = git_changed_slugs(args.git_diff) if args.git_diff else read_ledger()
+    urls = changed_urls(slugs, base)
+    if not urls:
+        print("OK", {"urls": 0, "skipped": "no changed pages"})
+        return 0
+
+    if args.dry_run:
+        print("\n".join(urls))
+        print("OK", {"urls": len(urls), "dry_run": True})
+        return 0
+
+    if not KEY:
+        print("Missing INDEXNOW_KEY")
+        return 2
+    if os.environ.get("CI"):
+        # The workflows push before submitting, so a key file written here would never be deployed.
+        if not key_file_ok(KEY):
+            print(f"Missing key file public/{KEY}.txt in the checkout; commit it (the key on one line) and deploy before submitting")
+            return 2
+    elif ensure_key_file(KEY):
+        print(f"Wrote key file {pipeline.path('PUBLIC_DIR') / f'{KEY}.txt'} (deploy it before the next submit)")
+
+    stats = submit(urls, KEY, base, args.endpoint, args.batch_size)
+    if not stats["failed_batches"] and not args.git_diff:
+        pipeline.path("CHANGED_LEDGER").unlink(missing_ok=True)
+
+    print("OK" if not stats["failed_batches"] else "FAILED", stats)
+    return 1 if stats["failed_batches"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,40 @@
+"""Shared fixtures for the pipeline stage tests.
+
+Stages are loaded through scripts/pipeline.py exactly as `vuka` loads them,
+pointed at a throwaway checkout with a couple of real landing pages.
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+REPO_ROOT = SCRIPTS_DIR.parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import pipeline  # noqa: E402
+
+PAGES = ["cheap-flights-from-london-to-lagos", "flights-to-lagos-from-uk"]
+
+
+@pytest.fixture
+def site(tmp_path: Path):
+    """A checkout with two Lagos pages and their Primary keyword rows; yields its root."""
+    public = tmp_path / "public"
+    for slug in PAGES:
+        (public / slug).mkdir(parents=True)
+        shutil.copy(REPO_ROOT / "public" / slug / "index.html", public / slug / "index.html")
+    (public / "landing-pages-keywords.csv").write_text(
+        "Location,Keyword,Landing URL,Template Type,Status\n"
+        + "".join(f"Lagos,{slug.replace('-', ' ')},https://vukatravels.co.uk/{slug}/,Primary,Created\n" for slug in PAGES),
+        encoding="utf-8",
+    )
+    pipeline.set_root(tmp_path)
+    try:
+        yield tmp_path
+    finally:
+        pipeline.set_root(REPO_ROOT)
@@ -0,0 +1,18 @@
+"""Route search index built from the fixture pages."""
+
+from __future__ import annotations
+
+import pipeline
+
+
+def test_placeholder_iata_codes_are_not_searchable(site):
+    page = site / "public" / "cheap-flights-from-london-to-lagos" / "index.html"
+    html = page.read_text(encoding="utf-8")
+    # A card the migration could only read as "LHR to XXX".
+    page.write_text(html.replace('data-dest="LOS"', 'data-dest="XXX"', 1), encoding="utf-8")
+
+    routes = pipeline.load_stage("build_route_index")
+    index = routes.build_index(routes.collect_pages())
+    words = index["words"][::2]
+    assert "xxx" not in words
+    assert {"lhr", "los", "lagos"} <= set(words)
@@ -0,0 +1,52 @@
+"""The migration's plain-Python page tiers match `vuka tiers` (scripts/fare_stats.py)."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import pipeline
+from conftest import SCRIPTS_DIR
+
+
+@pytest.mark.parametrize(
+    "prices",
+    [
+        [399, 358, 312],
+        [312, 312, 358, 399, None, 450],
+        [None, 275],
+        [500],
+        [None, None],
+        [210, 180, 180, 180, 240, 305, 305, 420, 515],
+    ],
+)
+def test_page_tiers_match_rank_tiers(prices):
+    migrate = pipeline.load_stage("migrate_fare_data_attrs")
+    fare_stats = pipeline.load_stage("fare_stats")
+    expected = fare_stats.rank_tiers(
+        np.zeros(len(prices), dtype=int), np.array([np.nan if p is None else p for p in prices], dtype=float)
+    )
+    assert migrate._page_tiers(prices) == list(expected)
+
+
+def test_migration_does_not_import_numpy():
+    code = f"import sys; sys.path.insert(0, {str(SCRIPTS_DIR)!r}); import migrate_fare_data_attrs; print('numpy' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip() == "False"
+
+
+def card(route: str, price: int | None) -> dict:
+    origin, dest = route.split("-")
+    return {"route": route, "origin": origin, "dest": dest, "price": price}
+
+
+def test_placeholder_codes_are_left_out_of_route_stats():
+    fare_stats = pipeline.load_stage("fare_stats")
+    # Dhaka and Islamabad cards the migration could only read as "LHR to XXX".
+    cards = [card("LHR-ACC", 399), card("LHR-XXX", 620), card("LHR-ACC", 358), card("LHR-XXX", 9999)]
+    cards.append({"route": "LHR-", "origin": "LHR", "dest": "", "price": 250})
+    stats, outlier = fare_stats.route_stats(cards)
+    assert [(s["route"], s["cards"], s["min"], s["max"]) for s in stats] == [("LHR-ACC", 2, 358.0, 399.0)]
+    assert outlier.tolist() == [False] * 5
@@ -0,0 +1,144 @@
+"""generate_llm_content against an in-process fake Ollama server (streamed NDJSON)."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+
+import pipeline
+
+GUIDE = "## Booking Lagos well\n" + "\n".join(f"- tip number {i} for the Lagos route" for i in range(160))
+
+
+class FakeOllama:
+    """Speaks just enough HTTP/1.1 for stream_generate(); `mode` picks the failure to simulate."""
+
+    def __init__(self, mode: str = "ok", text: str = GUIDE, delay: float = 0.0):
+        self.mode, self.text, self.delay = mode, text, delay
+        self.requests = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.requests += 1
+        if self.mode == "close":
+            writer.close()
+            return
+        length = 0
+        while (line := await reader.readline()) not in (b"\r\n", b""):
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        json.loads(await reader.readexactly(length))
+        await asyncio.sleep(self.delay)
+
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\n\r\n")
+        if self.mode == "truncated":
+            writer.write(b"400\r\n" + b'{"response": "cut')
+        else:
+            words = self.text.split(" ")
+            for i, word in enumerate(words):
+                msg = json.dumps({"response": word + ("" if i == len(words) - 1 else " "), "done": False}) + "\n"
+                writer.write(f"{len(msg.encode()):x}\r\n".encode() + msg.encode() + b"\r\n")
+            done = json.dumps({"response": "", "done": True}) + "\n"
+            writer.write(f"{len(done.encode()):x}\r\n".encode() + done.encode() + b"\r\n0\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+
+def run_against(server: FakeOllama, timeout: float = 5.0) -> dict:
+    gen = pipeline.load_stage("generate_llm_content")
+    fill = pipeline.load_stage("fill_landing_pages")
+    rows = fill.read_primary_rows()
+
+    async def scenario() -> dict:
+        srv = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        port = srv.sockets[0].getsockname()[1]
+        opts = argparse.Namespace(
+            url=f"http://127.0.0.1:{port}",
+            model="fake",
+            concurrency=2,
+            timeout=timeout,
+            min_words=gen.MIN_WORDS,
+            max_words=gen.MAX_WORDS,
+            cache_dir=pipeline.path("LLM_CACHE_DIR"),
+        )
+        async with srv:
+            return await gen.run(rows, opts)
+
+    return asyncio.run(scenario())
+
+
+def page(site, slug: str = "cheap-flights-from-london-to-lagos") -> str:
+    return (site / "public" / slug / "index.html").read_text(encoding="utf-8")
+
+
+def test_second_run_is_served_from_cache(site):
+    server = FakeOllama()
+    first = run_against(server)
+    assert first["generated"] == 2 and first["cache_hits"] == 0 and first["fallbacks"] == 0
+    assert "<h4>Booking Lagos well</h4>" in page(site)
+
+    second = run_against(server)
+    assert second["cache_hits"] == 2 and second["cache_hit_rate"] == 1.0
+    assert server.requests == 2  # nothing new reached the server
+    assert second["pages_per_sec"] > 0
+
+
+def make_static(site) -> None:
+    # The fixture pages ship with committed generated guides; give them the static one instead.
+    fill = pipeline.load_stage("fill_landing_pages")
+    for url, kw, loc in fill.read_primary_rows():
+        fp = fill.url_to_public_path(url)
+        fp.write_text(fill.inject_before_footer(fp.read_text(encoding="utf-8"), fill.build_blocks(kw, loc)[2]), encoding="utf-8")
+
+
+def test_timeout_falls_back_to_static_guide(site):
+    make_static(site)
+    stats = run_against(FakeOllama(delay=1.0), timeout=0.2)
+    assert stats["fallbacks"] == 2 and stats["generated"] == 0
+    assert "Start with your flexibility" in page(site)
+    assert not (pipeline.path("LLM_CACHE_DIR") / "index.json").exists()
+
+
+def test_timeout_keeps_the_committed_guide(site):
+    fill = pipeline.load_stage("fill_landing_pages")
+    committed = fill.page_guide(page(site))
+    assert committed is not None
+    stats = run_against(FakeOllama(delay=1.0), timeout=0.2)
+    assert stats["fallbacks"] == 2
+    assert fill.page_guide(page(site)) == committed
+
+
+def test_short_completion_falls_back_and_is_not_cached(site):
+    stats = run_against(FakeOllama(text="far too short"))
+    assert stats["fallbacks"] == 2
+    assert not list(pipeline.path("LLM_CACHE_DIR").glob("*.json"))
+
+
+def test_server_closing_without_status_line_falls_back(site):
+    stats = run_against(FakeOllama(mode="close"))
+    assert stats["fallbacks"] == 2 and stats["generated"] == 0
+
+
+def test_truncated_chunk_falls_back(site):
+    stats = run_against(FakeOllama(mode="truncated"))
+    assert stats["fallbacks"] == 2
+
+
+def test_fill_keeps_the_generated_guide(site):
+    run_against(FakeOllama())
+    fill = pipeline.load_stage("fill_landing_pages")
+    assert fill.main([]) == 0
+    assert "<h4>Booking Lagos well</h4>" in page(site)
+    assert "<h4>Booking Lagos well</h4>" in page(site, "flights-to-lagos-from-uk")
+
+
+def test_sync_without_the_cache_keeps_the_committed_guide(site):
+    # The sheet-sync workflow starts from a fresh checkout: .cache/llm/ is not there.
+    fill = pipeline.load_stage("fill_landing_pages")
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    committed = fill.page_guide(page(site))
+    slug = "cheap-flights-from-london-to-lagos"
+    row = [sync.SITE_KEY, "cheap flights from london to lagos", slug, "approved", "landing", "", "location=Lagos; template=cheap"]
+    idx = {name: i for i, name in enumerate(["site", "primary_keyword", "slug", "status", "content_type", "target_url", "notes"])}
+    sync.process_site_rows([(2, row)], idx)
+    assert fill.page_guide(page(site)) == committed
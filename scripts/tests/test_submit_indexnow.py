@@ -0,0 +1,101 @@
+"""submit_indexnow against a local http.server stand-in for the IndexNow endpoint."""
+
+from __future__ import annotations
+
+import json
+import threading
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import pipeline
+
+KEY = "0123456789abcdef"
+
+
+class FakeIndexNow:
+    """Answers POSTs with the scripted statuses (then 200) and records every payload."""
+
+    def __init__(self, statuses: list[int] | None = None):
+        self.statuses = list(statuses or [])
+        self.payloads: list[dict] = []
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                fake.payloads.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+                self.send_response(fake.statuses.pop(0) if fake.statuses else 200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/indexnow"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def indexnow(site, monkeypatch):
+    """The stage with a key, a committed key file, both Lagos pages in the ledger and no real sleeping."""
+    stage = pipeline.load_stage("submit_indexnow")
+    monkeypatch.setattr(stage, "KEY", KEY)
+    monkeypatch.delenv("CI", raising=False)
+    (site / "public" / f"{KEY}.txt").write_text(KEY + "\n", encoding="utf-8")
+    ledger = pipeline.path("CHANGED_LEDGER")
+    ledger.parent.mkdir(parents=True, exist_ok=True)
+    ledger.write_text("cheap-flights-from-london-to-lagos\nflights-to-lagos-from-uk\n", encoding="utf-8")
+    monkeypatch.setattr(stage, "sleeps", [], raising=False)
+    monkeypatch.setattr(stage, "time", types.SimpleNamespace(sleep=stage.sleeps.append))
+    return stage
+
+
+def test_urls_are_batched_and_the_ledger_cleared(indexnow):
+    with FakeIndexNow() as server:
+        assert indexnow.main(["--endpoint", server.url, "--batch-size", "1"]) == 0
+    assert [p["urlList"] for p in server.payloads] == [
+        ["https://vukatravels.co.uk/cheap-flights-from-london-to-lagos/"],
+        ["https://vukatravels.co.uk/flights-to-lagos-from-uk/"],
+    ]
+    assert server.payloads[0]["key"] == KEY
+    assert server.payloads[0]["keyLocation"] == f"https://vukatravels.co.uk/{KEY}.txt"
+    assert not pipeline.path("CHANGED_LEDGER").exists()
+
+
+def test_429_and_5xx_are_retried_with_backoff(indexnow):
+    with FakeIndexNow([429, 503]) as server:
+        assert indexnow.main(["--endpoint", server.url]) == 0
+    assert len(server.payloads) == 3
+    assert indexnow.sleeps == [indexnow.BACKOFF, indexnow.BACKOFF * 2]
+
+
+def test_403_is_not_retried_and_keeps_the_ledger(indexnow):
+    with FakeIndexNow([403]) as server:
+        assert indexnow.main(["--endpoint", server.url]) == 1
+    assert len(server.payloads) == 1 and indexnow.sleeps == []
+    assert pipeline.path("CHANGED_LEDGER").exists()
+
+
+def test_no_changed_pages_sends_nothing(indexnow):
+    pipeline.path("CHANGED_LEDGER").unlink()
+    with FakeIndexNow() as server:
+        assert indexnow.main(["--endpoint", server.url]) == 0
+    assert server.payloads == []
+
+
+def test_ci_refuses_to_write_a_missing_key_file(indexnow, site, monkeypatch):
+    monkeypatch.setenv("CI", "true")
+    (site / "public" / f"{KEY}.txt").unlink()
+    with FakeIndexNow() as server:
+        assert indexnow.main(["--endpoint", server.url]) == 2
+    assert server.payloads == []
+    assert not (site / "public" / f"{KEY}.txt").exists()
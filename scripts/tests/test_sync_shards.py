@@ -0,0 +1,84 @@
+"""Sharded sheet sync: `--shard i/N` per job, then `--merge`, must match an unsharded run."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import pipeline
+from conftest import REPO_ROOT
+
+COLUMNS = ["site", "primary_keyword", "slug", "status", "content_type", "target_url", "notes"]
+IDX = {name: i for i, name in enumerate(COLUMNS)}
+
+
+def sheet_row(keyword: str, template: str) -> list[str]:
+    # Notes as scripts/plan_route_matrix.py writes them.
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    slug = sync.slugify(keyword)
+    notes = f"location=Lusaka; template={template}"
+    return [sync.SITE_KEY, keyword, slug, "approved", "landing", f"https://vukatravels.co.uk/{slug}/", notes]
+
+
+def run_shards(rows: list[tuple[int, list[str]]], count: int) -> None:
+    # What each CI job does: sync only its own rows and leave a shard result behind.
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    shard_dir = pipeline.path("SHARD_DIR")
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(1, count + 1):
+        mine = [(n, r) for n, r in rows if sync.shard_index(sync.row_slug(r, IDX), count) == i]
+        result = sync.process_site_rows(mine, IDX, sharded=True)
+        (shard_dir / f"sync-shard-{i}-of-{count}.json").write_text(
+            json.dumps({"index": i, "count": count, "sites": [result]}), encoding="utf-8"
+        )
+
+
+def test_alias_whose_page_is_built_by_another_shard_is_merged(site):
+    for slug in ["cheap-flights-from-london-to-accra", "flights-to-accra-from-uk"]:
+        shutil.copytree(REPO_ROOT / "public" / slug, site / "public" / slug)
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    alias, canonical = "flights-from-leeds-to-lusaka", "cheap-flights-from-leeds-to-lusaka"
+    # The alias row comes first and lands in an earlier shard than its cheap-flights page.
+    assert sync.shard_index(alias, 2) < sync.shard_index(canonical, 2)
+    rows = [
+        (2, sheet_row("flights from leeds to lusaka", "alias")),
+        (3, sheet_row("cheap flights from leeds to lusaka", "cheap")),
+    ]
+
+    run_shards(rows, 2)
+    # Every shard ran in its own job, so the merging checkout starts without their ledgers.
+    pipeline.path("CHANGED_LEDGER").unlink()
+    assert sync.merge_shards(pipeline.path("SHARD_DIR")) == 0
+    assert pipeline.path("CHANGED_LEDGER").read_text(encoding="utf-8").split() == [canonical]
+
+    nginx_map = (site / "deploy" / "nginx-redirects.map").read_text(encoding="utf-8")
+    assert f"/{alias}/ /{canonical}/;" in nginx_map
+    assert f"^/{alias}(/" in (site / "public" / ".htaccess").read_text(encoding="utf-8")
+    assert "Redirect Alias" in (site / "public" / "landing-pages-keywords.csv").read_text(encoding="utf-8")
+
+
+def test_alias_without_a_page_is_left_for_a_later_sync(site):
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    result = sync.process_site_rows([(2, sheet_row("flights from leeds to lusaka", "alias"))], IDX)
+    assert result["skipped_aliases"] == 1
+    assert not (site / "public" / "flights-from-leeds-to-lusaka").exists()
+    assert "leeds-to-lusaka" not in (site / "public" / "landing-pages-keywords.csv").read_text(encoding="utf-8")
+
+
+def test_spawned_site_worker_uses_the_parent_checkout(site):
+    for slug in ["cheap-flights-from-london-to-accra", "flights-to-accra-from-uk"]:
+        shutil.copytree(REPO_ROOT / "public" / slug, site / "public" / slug)
+    sync = pipeline.load_stage("sync_from_sheet_vuka")
+    cfg = {"public_dir": "public", "base_url": sync.SITE_BASE, "brand": sync.DEFAULT_BRAND}
+    rows = [(2, sheet_row("cheap flights from leeds to lusaka", "cheap"))]
+
+    # A spawned worker starts from the module defaults; the multi-site pool must hand it the roots.
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        roots = (sync.REPO_ROOT, pipeline.root())
+        result = pool.submit(sync._run_site, sync.SITE_KEY, cfg, rows, IDX, True, roots).result()
+
+    assert result["changed_pages"] == ["cheap-flights-from-leeds-to-lusaka"]
+    assert (site / "public" / "cheap-flights-from-leeds-to-lusaka" / "index.html").exists()
+    assert not (REPO_ROOT / "public" / "cheap-flights-from-leeds-to-lusaka").exists()
@@ -0,0 +1,42 @@
+"""Watch mode keeps polling through a broken renderer or page."""
+
+from __future__ import annotations
+
+import re
+
+import pipeline
+
+WATCH = pipeline.load_stage("watch_landing_pages")
+BROKEN, OK = "cheap-flights-from-london-to-lagos", "flights-to-lagos-from-uk"
+
+
+def test_a_renderer_that_fails_to_import_keeps_the_last_one(site, monkeypatch):
+    watcher = WATCH.Watcher()
+    fill = watcher.fill
+
+    def reload_stage(name):
+        raise SyntaxError("saved mid-edit")
+
+    monkeypatch.setattr(pipeline, "reload_stage", reload_stage)
+    result = watcher.rebuild({"renderer"})
+    assert watcher.fill is fill
+    assert result["errors"] == ["renderer: SyntaxError('saved mid-edit')"]
+
+
+def test_a_page_without_a_footer_does_not_stop_the_others(site):
+    watcher = WATCH.Watcher()
+    page = site / "public" / BROKEN / "index.html"
+    html = page.read_text(encoding="utf-8")
+    html = re.sub(re.escape(watcher.fill.AUTO_START) + r".*?" + re.escape(watcher.fill.AUTO_END), "", html, flags=re.DOTALL)
+    page.write_text(re.sub(r"<footer\b.*?</footer>", "", html, flags=re.DOTALL), encoding="utf-8")
+    for slug in (BROKEN, OK):
+        watcher.rows[f"https://vukatravels.co.uk/{slug}/"] = ("changed keyword", "Lagos")
+    (site / "public" / "landing-pages-keywords.csv").write_text(
+        "Location,Keyword,Landing URL,Template Type,Status\n"
+        + "".join(f"Lagos,{s.replace('-', ' ')},https://vukatravels.co.uk/{s}/,Primary,Created\n" for s in (BROKEN, OK)),
+        encoding="utf-8",
+    )
+
+    result = watcher.rebuild({"csv"})
+    assert result["dirty"] == 2 and result["rendered"] == 1
+    assert len(result["errors"]) == 1 and "No <footer>" in result["errors"][0]
@@ -0,0 +1,166 @@
+"""`vuka` — one entry point for the landing-page pipeline.
+
+Subcommands:
+  sync      Pull approved rows from the master sheet and build/refresh pages (--shard i/N, --merge DIR)
+  fill      Re-render AUTO_SEO blocks for every Primary row in the keywords CSV (--shard i/N)
+  migrate   Add data-* fare attributes to fare cards
+  sitemap   Write dist/sitemap.xml (or public/sitemap.xml with --public)
+  submit    Submit the sitemap to Google Search Console
+  audit     Page weight report against budgets (extra args go to the auditor)
+  watch     Re-render only the pages whose CSV row, template or renderer changed
+  rebuild   Regenerate the pages whose source template changed (manifest-driven)
+  generate  Long-form route guides from a local Ollama-compatible LLM (cached)
+  indexnow  Submit the landing pages changed by this run via IndexNow
+  fares     Build public/fares.json, the per-route fare index landing-pages.js hydrates from
+  tiers     Route fare stats (NumPy) and data-fare-tier by price rank (needs numpy)
+  plan      Stream origins x destinations x phrases into planned sheet rows (CSV or sheet)
+  routes    Build public/route-index.json, the client-side route search index
+  logos     Minify the airline logos into one content-hashed <symbol> sprite
+
+Stages are imported only when their subcommand runs, so offline commands never
+load the Google client libraries.
+
+Run:
+  python scripts/vuka.py fill
+  python scripts/vuka.py --root /path/to/checkout audit --root dist
+  npm run vuka -- sitemap --public
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import pipeline
+
+
+def cmd_sync(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("sync_from_sheet_vuka").main(args.extra)
+
+
+def cmd_fill(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("fill_landing_pages").main(args.extra)
+
+
+def cmd_migrate(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("migrate_fare_data_attrs").main()
+
+
+def cmd_sitemap(args: argparse.Namespace) -> int:
+    if args.public:
+        pipeline.load_stage("sync_from_sheet_vuka").generate_sitemap()
+        print(f"Wrote {pipeline.path('SITEMAP_XML')}")
+        return 0
+    return pipeline.load_stage("generate_sitemap").main()
+
+
+def cmd_submit(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("submit_sitemap_gsc").main()
+
+
+def cmd_audit(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("audit_page_weight").main(args.extra)
+
+
+def cmd_watch(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("watch_landing_pages").main(args.extra)
+
+
+def cmd_rebuild(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("rebuild_from_templates").main(args.extra)
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("generate_llm_content").main(args.extra)
+
+
+def cmd_indexnow(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("submit_indexnow").main(args.extra)
+
+
+def cmd_fares(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("build_fares_index").main(args.extra)
+
+
+def cmd_tiers(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("fare_stats").main(args.extra)
+
+
+def cmd_plan(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("plan_route_matrix").main(args.extra)
+
+
+def cmd_routes(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("build_route_index").main(args.extra)
+
+
+def cmd_logos(args: argparse.Namespace) -> int:
+    return pipeline.load_stage("build_logo_sprite").main(args.extra)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="vuka", description="VUKA landing-page pipeline")
+    ap.add_argument("--root", type=Path, default=None, help="Repo checkout to operate on (default: this repo)")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    # sync/fill take --shard i/N (and sync --merge DIR) for CI matrix runs.
+    p = sub.add_parser("sync", help="Sync landing pages from the master sheet", add_help=False)
+    p.set_defaults(func=cmd_sync, passthrough=True)
+    p = sub.add_parser("fill", help="Re-render AUTO_SEO blocks from the keywords CSV", add_help=False)
+    p.set_defaults(func=cmd_fill, passthrough=True)
+    sub.add_parser("migrate", help="Add data-* attributes to fare cards").set_defaults(func=cmd_migrate)
+
+    p = sub.add_parser("sitemap", help="Generate the sitemap")
+    p.add_argument("--public", action="store_true", help="Write public/sitemap.xml instead of dist/sitemap.xml")
+    p.set_defaults(func=cmd_sitemap)
+
+    sub.add_parser("submit", help="Submit the sitemap to Google Search Console").set_defaults(func=cmd_submit)
+
+    # Everything after `audit` is handed to scripts/audit_page_weight.py unchanged.
+    p = sub.add_parser("audit", help="Page weight report (e.g. vuka audit --root dist)", add_help=False)
+    p.set_defaults(func=cmd_audit, passthrough=True)
+
+    p = sub.add_parser("watch", help="Re-render changed pages as inputs are edited", add_help=False)
+    p.set_defaults(func=cmd_watch, passthrough=True)
+
+    p = sub.add_parser("rebuild", help="Roll template edits out to dependant pages", add_help=False)
+    p.set_defaults(func=cmd_rebuild, passthrough=True)
+
+    p = sub.add_parser("generate", help="Generate route guides with a local LLM", add_help=False)
+    p.set_defaults(func=cmd_generate, passthrough=True)
+
+    p = sub.add_parser("indexnow", help="Submit changed pages via IndexNow", add_help=False)
+    p.set_defaults(func=cmd_indexnow, passthrough=True)
+
+    p = sub.add_parser("fares", help="Build the route fare index (public/fares.json)", add_help=False)
+    p.set_defaults(func=cmd_fares, passthrough=True)
+
+    p = sub.add_parser("tiers", help="Route fare stats and price-ranked tiers", add_help=False)
+    p.set_defaults(func=cmd_tiers, passthrough=True)
+
+    p = sub.add_parser("plan", help="Plan pages from the route matrix", add_help=False)
+    p.set_defaults(func=cmd_plan, passthrough=True)
+
+    p = sub.add_parser("routes", help="Build the route search index", add_help=False)
+    p.set_defaults(func=cmd_routes, passthrough=True)
+
+    p = sub.add_parser("logos", help="Build the airline-logo sprite", add_help=False)
+    p.set_defaults(func=cmd_logos, passthrough=True)
+
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = build_parser()
+    args, extra = ap.parse_known_args(argv)
+    if extra and not getattr(args, "passthrough", False):
+        ap.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.extra = extra
+    if args.root is not None:
+        pipeline.set_root(args.root)
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
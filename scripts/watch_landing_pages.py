@@ -0,0 +1,177 @@
+"""Watch mode for local content work: re-render only the pages whose inputs changed.
+
+Why:
+- Content is produced locally (sheet rows, LLM copy) and then pushed. A full
+  fill run after every CSV or template tweak is slow and rewrites every page.
+
+What it does:
+- Polls public/landing-pages-keywords.csv, the template pages and the
+  renderer (.github/scripts/fill_landing_pages.py)
+- Waits until the inputs have been quiet for --debounce seconds, then:
+  - CSV edit: re-renders only the Primary rows that were added or changed
+  - template edit: rebuilds the template's dependants from the page manifest
+    (see scripts/rebuild_from_templates.py)
+  - renderer edit: reloads the renderer and re-renders every Primary row
+- Regenerates public/sitemap.xml whenever the set of landing pages changes
+- Never exits on a bad input: a renderer saved mid-edit keeps the last one
+  that loaded, a page that cannot be rendered is skipped, and the error is
+  printed until the next save fixes it
+
+Run:
+  python scripts/vuka.py watch
+  python scripts/watch_landing_pages.py --interval 0.25 --debounce 0.4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+import pipeline
+
+
+def _stamp(fp: Path) -> tuple[int, int] | None:
+    try:
+        st = fp.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _page_dirs() -> frozenset[str]:
+    public = pipeline.path("PUBLIC_DIR")
+    return frozenset(d.name for d in public.iterdir() if (d / "index.html").exists())
+
+
+class Watcher:
+    def __init__(self) -> None:
+        self.fill = pipeline.load_stage("fill_landing_pages")
+        self.sync = pipeline.load_stage("sync_from_sheet_vuka")
+        self.renderer = pipeline.stage_path("fill_landing_pages")
+        self.rows = self._read_rows()
+        self.pages = _page_dirs()
+        self.stamps = self._snapshot()
+
+    def _templates(self) -> dict[str, Path]:
+        public = pipeline.path("PUBLIC_DIR")
+        slugs = [self.sync.TEMPLATE_PRIMARY_CHEAP, self.sync.TEMPLATE_PRIMARY_UK]
+        return {slug: public / slug / "index.html" for slug in slugs}
+
+    def _inputs(self) -> dict[str, Path]:
+        inputs = {"csv": pipeline.path("KEYWORDS_CSV"), "renderer": self.renderer}
+        inputs.update({f"template:{slug}": fp for slug, fp in self._templates().items()})
+        return inputs
+
+    def _snapshot(self) -> dict[str, tuple[int, int] | None]:
+        return {key: _stamp(fp) for key, fp in self._inputs().items()}
+
+    def _read_rows(self) -> dict[str, tuple[str, str]]:
+        if not self.fill.KEYWORDS_CSV.exists():
+            return {}
+        return {url: (kw, loc) for url, kw, loc in self.fill.read_primary_rows()}
+
+    def rebuild(self, changed: set[str]) -> dict:
+        started = time.perf_counter()
+        dirty: set[str] = set()
+        errors: list[str] = []
+
+        reloaded = False
+        if "renderer" in changed:
+            try:
+                self.fill = pipeline.reload_stage("fill_landing_pages")
+                reloaded = True
+            except Exception as e:
+                # Usually saved mid-edit: keep rendering with the last renderer that loaded.
+                errors.append(f"renderer: {e!r}")
+        if reloaded:
+            self.rows = self._read_rows()
+            dirty.update(self.rows)
+        elif "csv" in changed:
+            rows = self._read_rows()
+            dirty.update(url for url, val in rows.items() if self.rows.get(url) != val)
+            self.rows = rows
+
+        rendered = 0
+        for key in changed:
+            if key.startswith("template:"):
+                # Roll the template chrome out to its manifest dependants; the template page's
+                # own row is re-filled like any other.
+                slug = key.split(":", 1)[1]
+                try:
+                    rendered += pipeline.load_stage("rebuild_from_templates").rebuild(slug)["rewritten"]
+                except Exception as e:
+                    errors.append(f"template {slug}: {e!r}")
+                dirty.update(url for url in self.rows if self.fill.url_to_public_path(url).parent.name == slug)
+
+        for url in sorted(dirty):
+            try:
+                if url in self.rows and self.fill.fill_page(url, *self.rows[url]):
+                    rendered += 1
+            except Exception as e:
+                # e.g. ValueError from a page without a <footer>; the other pages still render.
+                errors.append(f"{url}: {e!r}")
+
+        sitemap = False
+        pages = _page_dirs()
+        if pages != self.pages:
+            self.sync.generate_sitemap()
+            self.pages = pages
+            sitemap = True
+
+        # Re-stat after writing so our own edits (e.g. to a template page) do not retrigger.
+        self.stamps = self._snapshot()
+        return {
+            "changed": sorted(changed),
+            "dirty": len(dirty),
+            "rendered": rendered,
+            "sitemap": sitemap,
+            "errors": errors,
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def run(self, interval: float, debounce: float) -> None:
+        seen, pages_seen = self.stamps, self.pages
+        dirty_since: float | None = None
+        print("Watching", {key: str(fp) for key, fp in self._inputs().items()})
+        while True:
+            now, pages = self._snapshot(), _page_dirs()
+            if now != seen or pages != pages_seen:
+                # Every further edit restarts the quiet period.
+                seen, pages_seen = now, pages
+                dirty_since = time.monotonic()
+
+            if dirty_since is not None and time.monotonic() - dirty_since >= debounce:
+                changed = {key for key, stamp in now.items() if stamp != self.stamps.get(key)}
+                try:
+                    result = self.rebuild(changed)
+                    print("OK" if not result["errors"] else "ERROR", result)
+                except Exception as e:
+                    # Keep polling; the next save retries.
+                    self.stamps = self._snapshot()
+                    print("ERROR", {"changed": sorted(changed), "error": repr(e)})
+                seen, pages_seen = self.stamps, self.pages
+                dirty_since = None
+
+            time.sleep(interval)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Re-render landing pages as their inputs change.")
+    ap.add_argument("--interval", type=float, default=0.25, help="Polling interval in seconds")
+    ap.add_argument("--debounce", type=float, default=0.4, help="Quiet period before rebuilding, in seconds")
+    args = ap.parse_args(argv)
+
+    if not pipeline.path("KEYWORDS_CSV").exists():
+        print(f"Missing {pipeline.path('KEYWORDS_CSV')}")
+        return 2
+
+    try:
+        Watcher().run(args.interval, args.debounce)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())